@@ -9,7 +9,7 @@ from plotly.subplots import make_subplots
 import os
 import sys
 from datetime import datetime
-import pytz  # Import pytz for timezone handling
+from zoneinfo import ZoneInfo  # stdlib timezone handling
 
 # Add the current directory to the path so we can import the package
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -37,6 +37,56 @@ def setup_config_paths():
 # Call the setup function
 setup_config_paths()
 
+# Timezone object built once at module scope - reused on every rerun
+_EASTERN = ZoneInfo('US/Eastern')
+
+# Precomputed ordinal suffixes (1 -> 'st', 2 -> 'nd', ...) for placement labels
+_SUFFIX = tuple(
+    'th' if 10 <= n % 100 <= 20 else {1: 'st', 2: 'nd', 3: 'rd'}.get(n % 10, 'th')
+    for n in range(101)
+)
+
+# Column selection and rename map for the Wrestler Details table - constant,
+# so the select/rename is applied once at load time rather than per filter click
+_WRESTLER_COLS = ['Wrestler', 'weight', 'seed', 'owner',
+                  'champ_wins', 'champ_advancement', 'champ_bonus',
+                  'cons_wins', 'cons_advancement', 'cons_bonus',
+                  'placement', 'placement_points', 'total_points']
+_WRESTLER_RENAME = {
+    'Wrestler': 'Wrestler',
+    'weight': 'Weight',
+    'seed': 'Seed',
+    'owner': 'Team',
+    'champ_wins': 'Champ Wins',
+    'champ_advancement': 'Champ Adv Pts',
+    'champ_bonus': 'Champ Bonus Pts',
+    'cons_wins': 'Cons Wins',
+    'cons_advancement': 'Cons Adv Pts',
+    'cons_bonus': 'Cons Bonus Pts',
+    'placement': 'Placement',
+    'placement_points': 'Place Pts',
+    'total_points': 'Total Pts'
+}
+
+# Placement category -> (number, ordinal suffix), precomputed so the hover
+# template patch below is a constant-time dict lookup per trace
+PLACEMENT_META = {
+    "Champion (1st)": (1, "st"),
+    "Runner-up (2nd)": (2, "nd"),
+    "Third Place (3rd)": (3, "rd"),
+    **{f"Placed ({n}th)": (n, "th") for n in range(4, 9)}
+}
+
+# Shared plotting constants built once at import instead of per rerun
+_WEIGHT_ORDER = ('125', '133', '141', '149', '157', '165', '174', '184', '197', '285', 'DH')
+_HEATMAP_COLORSCALE = [
+    [0, 'rgb(220, 53, 69)'],         # Red for zero
+    [0.001, 'rgb(255, 255, 224)'],   # Light yellow
+    [0.3, 'rgb(173, 216, 230)'],     # Light blue
+    [0.6, 'rgb(102, 204, 255)'],     # Medium blue
+    [1, 'rgb(0, 0, 128)']            # Navy blue
+]
+
 # Set page configuration
 st.set_page_config(
     page_title="NCAA Wrestling Draft Tracker", 
@@ -45,8 +95,7 @@ st.set_page_config(
 )
 
 # Get current time in EST timezone
-eastern = pytz.timezone('US/Eastern')
-est_time = datetime.now(eastern)
+est_time = datetime.now(_EASTERN)
 formatted_time = est_time.strftime("%m/%d/%Y %I:%M:%S %p EST")  # 12-hour format with AM/PM
 
 # Page header
@@ -64,48 +113,324 @@ update_button = st.sidebar.button("Update Results")
 st.sidebar.markdown("---")
 st.sidebar.markdown("Track NCAA Wrestling Tournament results for fantasy drafts")
 
+# Shrink DataFrame memory: downcast numeric columns and store repeated
+# strings as category dtype so later groupby/pivot ops work on smaller arrays
+def _shrink_frames(*frames):
+    for df in frames:
+        for c in df.select_dtypes('int64').columns:
+            df[c] = pd.to_numeric(df[c], downcast='integer')
+        for c in df.select_dtypes('float64').columns:
+            df[c] = pd.to_numeric(df[c], downcast='float')
+        for c in ('owner', 'Owner', 'weight', 'Weight', 'Wrestler'):
+            if c in df.columns:
+                df[c] = df[c].astype('category')
+
+# Cached pipeline - keyed on input file mtimes so the expensive parsing only
+# re-runs when the underlying data files actually change
+@st.cache_data(ttl=300, show_spinner="Loading tournament results...")
+def _compute_results(results_mtime: float, draft_mtime: float):
+    # Run the main function from your package
+    results_df, round_df, placements_df = main(return_results=True)
+    team_summary = calculate_team_points(results_df)
+    _shrink_frames(results_df, round_df, placements_df, team_summary)
+    return results_df, round_df, placements_df, team_summary
+
 # Function to load or process data
 def load_or_process_data():
     if update_button or 'results_df' not in st.session_state:
-        with st.spinner("Loading tournament results..."):
-            try:
-                # Run the main function from your package
-                results_df, round_df, placements_df = main(return_results=True)
-                
-                # Only show an error if explicitly updating
-                if 'champ_wins' not in results_df.columns and update_button:
-                    st.warning("Data missing expected columns")
-                
-                team_summary = calculate_team_points(results_df)
-                
-                # Save to session state
-                st.session_state['results_df'] = results_df
-                st.session_state['round_df'] = round_df
-                st.session_state['placements_df'] = placements_df
-                st.session_state['team_summary'] = team_summary
-                
-                # Only show success message if explicitly updating
-                if update_button:
-                    st.success("Results updated successfully!")
-            except Exception as e:
-                # Only show error if explicitly updating
-                if update_button:
-                    st.error(f"Error processing results: {e}")
-                    
-                # Create empty DataFrames if needed
-                if 'results_df' not in st.session_state:
-                    st.session_state['results_df'] = pd.DataFrame()
-                    st.session_state['round_df'] = pd.DataFrame()
-                    st.session_state['team_summary'] = pd.DataFrame()
-                    st.session_state['placements_df'] = pd.DataFrame()
+        try:
+            # Force a fresh computation when explicitly updating
+            if update_button:
+                _compute_results.clear()
+
+            # File mtimes act as the cache key - unchanged files hit the cache
+            results_mtime = os.path.getmtime(config.RESULTS_FILE)
+            draft_mtime = os.path.getmtime(config.DRAFT_CSV)
+            results_df, round_df, placements_df, team_summary = _compute_results(results_mtime, draft_mtime)
+
+            # Only show an error if explicitly updating
+            if 'champ_wins' not in results_df.columns and update_button:
+                st.warning("Data missing expected columns")
+
+            # Save to session state
+            st.session_state['results_df'] = results_df
+            st.session_state['round_df'] = round_df
+            st.session_state['placements_df'] = placements_df
+            st.session_state['team_summary'] = team_summary
+
+            # Precompute filter option lists so widget reruns don't re-sort
+            if not round_df.empty:
+                st.session_state['weight_options_round'] = ['All'] + sorted(round_df['Weight'].unique().tolist())
+                st.session_state['team_options_round'] = ['All'] + sorted(round_df['Owner'].unique().tolist())
+            if not results_df.empty:
+                st.session_state['team_options_results'] = ['All'] + sorted(results_df['owner'].unique().tolist())
+                st.session_state['weight_options_results'] = ['All'] + sorted(results_df['weight'].unique().tolist())
+            if not placements_df.empty:
+                st.session_state['weight_options_placements'] = ['All'] + sorted(placements_df['weight'].unique().tolist())
+
+            # Build the wrestler -> owner map once; the 'Wrestler' column is
+            # already in "name (school)" format
+            if not results_df.empty and 'Wrestler' in results_df.columns:
+                st.session_state['wrestler_to_owner'] = pd.Series(
+                    results_df['owner'].to_numpy(), index=results_df['Wrestler'].to_numpy()
+                ).to_dict()
+
+            # Pre-render the Wrestler Details display frame once per data load
+            if not results_df.empty:
+                cols = [c for c in _WRESTLER_COLS if c in results_df.columns]
+                st.session_state['wrestler_display_df'] = results_df[cols].rename(columns=_WRESTLER_RENAME)
+
+            # Only show success message if explicitly updating
+            if update_button:
+                st.success("Results updated successfully!")
+        except Exception as e:
+            # Only show error if explicitly updating
+            if update_button:
+                st.error(f"Error processing results: {e}")
+
+            # Create empty DataFrames if needed
+            if 'results_df' not in st.session_state:
+                st.session_state['results_df'] = pd.DataFrame()
+                st.session_state['round_df'] = pd.DataFrame()
+                st.session_state['team_summary'] = pd.DataFrame()
+                st.session_state['placements_df'] = pd.DataFrame()
+
+# Helper to build a fast, primitive cache key from a DataFrame's values
+def _df_hash(df) -> bytes:
+    return pd.util.hash_pandas_object(df).values.tobytes()
+
+# Cached chart builders - keyed on a hash of the underlying values so unrelated
+# reruns (filter clicks, sidebar toggles) reuse the already-built figures.
+# The underscore-prefixed DataFrame args are excluded from the cache key.
+@st.cache_data
+def build_team_bar(df_hash: bytes, _team_df: pd.DataFrame) -> go.Figure:
+    bar_fig = px.bar(
+        _team_df,
+        y='owner',
+        x='total_points',
+        orientation='h',
+        color='total_points',
+        color_continuous_scale='Viridis',
+        text='total_points',
+        labels={
+            'owner': 'Team',
+            'total_points': 'Total Points'
+        }
+    )
+
+    bar_fig.update_layout(
+        title='Team Rankings by Total Points',
+        yaxis={'categoryorder': 'total ascending'},
+        height=400
+    )
+
+    return bar_fig
+
+@st.cache_data
+def build_points_breakdown(df_hash: bytes, _team_df: pd.DataFrame) -> go.Figure:
+    # Create a plotly stacked bar chart
+    fig = go.Figure()
+
+    # Add advancement points
+    fig.add_trace(go.Bar(
+        name='Advancement',
+        x=_team_df['owner'],
+        y=_team_df['total_advancement'],
+        marker_color='#1f77b4',
+        text=_team_df['total_advancement'].round(1),
+        textposition='auto'
+    ))
+
+    # Add bonus points
+    fig.add_trace(go.Bar(
+        name='Bonus',
+        x=_team_df['owner'],
+        y=_team_df['total_bonus'],
+        marker_color='#ff7f0e',
+        text=_team_df['total_bonus'].round(1),
+        textposition='auto'
+    ))
+
+    # Add placement points
+    fig.add_trace(go.Bar(
+        name='Placement',
+        x=_team_df['owner'],
+        y=_team_df['placement_points'],
+        marker_color='#2ca02c',
+        text=_team_df['placement_points'].round(1),
+        textposition='auto'
+    ))
+
+    # Update layout
+    fig.update_layout(
+        barmode='stack',
+        title='Team Points by Category',
+        xaxis_title='Team',
+        yaxis_title='Points',
+        legend_title='Point Category',
+        height=500
+    )
+
+    return fig
+
+@st.cache_data
+def build_weight_heatmap(df_hash: bytes, _pivot_data: pd.DataFrame) -> go.Figure:
+    # Build the text and text-color matrices in two vectorized passes
+    vals = _pivot_data.values
+    text_matrix = vals.astype(np.int64).astype(str)
+    text_color_matrix = np.where((vals == 0) | (vals >= 15), 'white', 'black')
+
+    # Create the heatmap with built-in text template
+    fig = go.Figure(data=go.Heatmap(
+        z=_pivot_data.values,
+        x=_pivot_data.columns,
+        y=_pivot_data.index,
+        colorscale=_HEATMAP_COLORSCALE,
+        showscale=True,
+        zmin=0,
+        text=text_matrix,
+        texttemplate="%{text}",
+        textfont={"size": 12}
+    ))
+
+    # Configure layout
+    fig.update_layout(
+        title="Points by Team and Weight Class",
+        height=600,
+        xaxis=dict(
+            title="Weight Class",
+            side="bottom"
+        ),
+        yaxis=dict(
+            title="Team",
+            autorange="reversed"
+        )
+    )
+
+    return fig
+
+# Cached All-Americans computation shared by the analytics sections - one
+# boolean mask + filter per data change instead of one per rerun per section
+@st.cache_data
+def compute_all_americans(results_hash: bytes, _results_df: pd.DataFrame):
+    mask = _results_df['placement'].notna() & (_results_df['placement'] <= 8)
+    aa_df = _results_df.loc[mask].copy()
+    counts = aa_df['owner'].value_counts()
+    return aa_df, counts
+
+# Helper function for ordinal suffixes - O(1) table lookup
+def get_placement_suffix(n):
+    return _SUFFIX[n] if n < 101 else 'th'
+
+# Cached aggregation and figure build for the All-Americans chart, so checkbox
+# toggles and other reruns reuse the finished figure instead of rebuilding it
+@st.cache_data
+def _aa_by_team(aa_hash: bytes, _aa_df: pd.DataFrame) -> pd.DataFrame:
+    # observed=True: owner is categorical, and teams with no All-Americans
+    # should not get phantom zero rows (or stray zero annotations)
+    aa_by_team = _aa_df.groupby('owner', observed=True).size().reset_index(name='total_aa')
+    return aa_by_team.sort_values('total_aa', ascending=False)
+
+@st.cache_data
+def _build_aa_figure(aa_hash: bytes, _aa_df: pd.DataFrame, _aa_by_team_df: pd.DataFrame) -> go.Figure:
+    # Custom color scheme - gold, silver, bronze, and other colors for the rest
+    colors = {
+        "Champion (1st)": '#FFD700',     # Gold for champions
+        "Runner-up (2nd)": '#C0C0C0',    # Silver for runners-up
+        "Third Place (3rd)": '#CD7F32',  # Bronze for third
+        "Placed (4th)": '#1E90FF',       # Blue for 4th
+        "Placed (5th)": '#32CD32',       # Green for 5th
+        "Placed (6th)": '#9370DB',       # Purple for 6th
+        "Placed (7th)": '#FF6347',       # Tomato for 7th
+        "Placed (8th)": '#20B2AA'        # Light sea green for 8th
+    }
+
+    # Pre-aggregate to one bar segment per (team, placement category) and
+    # build go.Bar traces directly - px.bar on the raw wrestler-level rows
+    # sends one segment per wrestler, so this shrinks the figure payload.
+    # Wrestler/weight arrive as category dtype from _shrink_frames; cast
+    # them back to str first because pandas cannot store the list-valued
+    # aggregates below in a Categorical column
+    work = _aa_df.assign(Wrestler=_aa_df['Wrestler'].astype(str),
+                         weight=_aa_df['weight'].astype(str))
+    agg = work.groupby(['owner', 'placement_category'], sort=False, observed=True).agg(
+        count=('Wrestler', 'size'),
+        wrestlers=('Wrestler', list),
+        weights=('weight', list)
+    ).reset_index()
+
+    fig = go.Figure()
+    for category in PLACEMENT_META:
+        sub = agg[agg['placement_category'] == category]
+        if sub.empty:
+            continue
+        placement_num, suffix = PLACEMENT_META[category]
+        fig.add_bar(
+            y=sub['owner'],
+            x=sub['count'],
+            name=category,
+            orientation='h',
+            marker_color=colors[category],
+            customdata=np.stack([sub['wrestlers'], sub['weights']], axis=-1),
+            hovertemplate=f'<b>%{{customdata[0]}}</b><br>Weight: %{{customdata[1]}}<br>Placement: {placement_num}{suffix}<extra></extra>'
+        )
+
+    # With many (team x placement) segments, drop the per-segment outline so
+    # the SVG node styling stays cheap as rosters grow
+    if len(_aa_by_team_df) * len(PLACEMENT_META) > 200:
+        fig.update_traces(marker_line_width=0)
+
+    # Update layout
+    fig.update_layout(
+        title='All-Americans Distribution by Placement',
+        xaxis_title='All-Americans',
+        yaxis_title='Team',
+        height=500,
+        barmode='stack',
+        yaxis={'categoryorder': 'total ascending'},
+        legend_title_text='Placement',
+        hovermode='closest'
+    )
+
+    # Add annotations with total counts at the end of each bar - one row per
+    # team already, so zip the two columns directly with no per-row namedtuple
+    for owner, total_aa in zip(_aa_by_team_df['owner'].to_numpy(),
+                               _aa_by_team_df['total_aa'].to_numpy()):
+        fig.add_annotation(
+            x=total_aa + 0.1,  # Position annotation just past the end of the bar
+            y=owner,
+            text=f"{total_aa}",
+            showarrow=False,
+            font=dict(size=12)
+        )
+
+    return fig
+
+# Cached pivot of points by team and weight class - only rebuilt when the
+# underlying results change, not on every analytics-tab rerun
+@st.cache_data
+def build_weight_pivot(results_hash: bytes, _results_df: pd.DataFrame) -> pd.DataFrame:
+    pivot_data = _results_df.pivot_table(
+        values='total_points',
+        index='owner',
+        columns='weight',
+        aggfunc='sum',
+        fill_value=0
+    )
+
+    # Ensure weight classes are in correct order
+    available_weights = [w for w in _WEIGHT_ORDER if w in pivot_data.columns]
+    return pivot_data[available_weights]
 
 # Load the data
 load_or_process_data()
 
-# Create tabs for different views
-tabs = st.tabs(["Team Standings", "Round-by-Round", "Wrestler Details", "Placements", "Analytics (Beta)"])
+# View selector - unlike st.tabs, only the active view's body runs per rerun,
+# so heavy tabs (analytics) don't execute while the user is elsewhere
+TAB_NAMES = ["Team Standings", "Round-by-Round", "Wrestler Details", "Placements", "Analytics (Beta)"]
+active_tab = st.radio("View", TAB_NAMES, horizontal=True, label_visibility="collapsed")
 
-with tabs[0]:
+def render_team_standings():
     st.header("Team Standings")
     if 'team_summary' in st.session_state and not st.session_state['team_summary'].empty:
         # Display the team standings table
@@ -125,26 +450,8 @@ with tabs[0]:
         
         # Create horizontal bar chart of total points - moved from Enhanced Rankings
         team_df_sorted = team_df.sort_values('total_points', ascending=False)
-        bar_fig = px.bar(
-            team_df_sorted, 
-            y='owner', 
-            x='total_points',
-            orientation='h',
-            color='total_points',
-            color_continuous_scale='Viridis',
-            text='total_points',
-            labels={
-                'owner': 'Team',
-                'total_points': 'Total Points'
-            }
-        )
-        
-        bar_fig.update_layout(
-            title='Team Rankings by Total Points',
-            yaxis={'categoryorder': 'total ascending'},
-            height=400
-        )
-        
+        bar_fig = build_team_bar(_df_hash(team_df_sorted[['owner', 'total_points']]), team_df_sorted)
+
         # Display chart and table side by side
         col1, col2 = st.columns([1, 1])
         
@@ -157,7 +464,7 @@ with tabs[0]:
     else:
         st.info("No team standings data available. Please update results.")
 
-with tabs[1]:
+def render_round_by_round():
     st.header("Round-by-Round Results")
     if 'round_df' in st.session_state and not st.session_state['round_df'].empty:
         round_df = st.session_state['round_df']
@@ -165,41 +472,43 @@ with tabs[1]:
         # Add filters
         col1, col2 = st.columns(2)
         with col1:
-            weight_classes = ['All'] + sorted(round_df['Weight'].unique().tolist())
+            weight_classes = st.session_state['weight_options_round']
             selected_weight = st.selectbox("Filter by Weight Class:", weight_classes)
-        
+
         with col2:
-            teams = ['All'] + sorted(round_df['Owner'].unique().tolist())
+            teams = st.session_state['team_options_round']
             selected_team = st.selectbox("Filter by Team:", teams)
         
-        # Apply filters
-        filtered_df = round_df.copy()
+        # Apply filters with a single combined mask and one slice
+        mask = np.ones(len(round_df), dtype=bool)
         if selected_weight != 'All':
-            filtered_df = filtered_df[filtered_df['Weight'] == selected_weight]
+            mask &= (round_df['Weight'].to_numpy() == selected_weight)
         if selected_team != 'All':
-            filtered_df = filtered_df[filtered_df['Owner'] == selected_team]
+            mask &= (round_df['Owner'].to_numpy() == selected_team)
+        filtered_df = round_df[mask]
         
-        # Modified highlight function that only formats round columns
-        def highlight_results(val, col_name):
+        # Vectorized highlight function - two np.char.startswith passes instead
+        # of one Python callback per cell
+        def style_results(df):
+            arr = df.to_numpy(dtype=object)
+            sarr = arr.astype(str)
+            out = np.full(arr.shape, '', dtype=object)
+            out[np.char.startswith(sarr, 'W')] = 'background-color: #c6efce; color: #006100'  # Green for wins
+            out[np.char.startswith(sarr, 'L')] = 'background-color: #ffc7ce; color: #9c0006'  # Red for losses
+            styles = pd.DataFrame(out, index=df.index, columns=df.columns)
+
             # Skip formatting for descriptive columns
-            if col_name in ['Weight', 'Wrestler', 'School', 'Seed', 'Owner', 'Wrestler ID']:
-                return ''
-            
-            # Apply formatting only to round result columns
-            if pd.isna(val):
-                return ''
-            elif isinstance(val, str) and val.startswith('W'):
-                return 'background-color: #c6efce; color: #006100'  # Green for wins
-            elif isinstance(val, str) and val.startswith('L'):
-                return 'background-color: #ffc7ce; color: #9c0006'  # Red for losses
-            return ''
-        
-        # Apply styling with column-aware function and display
-        st.dataframe(filtered_df.style.apply(lambda x: x.apply(highlight_results, col_name=x.name)), use_container_width=True)
+            skip_cols = [col for col in ['Weight', 'Wrestler', 'School', 'Seed', 'Owner', 'Wrestler ID']
+                         if col in styles.columns]
+            styles[skip_cols] = ''
+            return styles
+
+        # Apply styling in a single vectorized pass and display
+        st.dataframe(filtered_df.style.apply(style_results, axis=None), use_container_width=True)
     else:
         st.info("No round-by-round data available. Please update results.")
 
-with tabs[2]:
+def render_wrestler_details():
     st.header("Wrestler Details")
     if 'results_df' in st.session_state and not st.session_state['results_df'].empty:
         results_df = st.session_state['results_df']
@@ -207,45 +516,24 @@ with tabs[2]:
         # Add filters
         col1, col2 = st.columns(2)
         with col1:
-            teams = ['All'] + sorted(results_df['owner'].unique().tolist())
+            teams = st.session_state['team_options_results']
             selected_team = st.selectbox("Filter by Team:", teams, key="wrestler_team")
-        
+
         with col2:
-            weight_classes = ['All'] + sorted(results_df['weight'].unique().tolist())
+            weight_classes = st.session_state['weight_options_results']
             selected_weight = st.selectbox("Filter by Weight Class:", weight_classes, key="wrestler_weight")
         
-        # Apply filters
-        filtered_df = results_df.copy()
+        # Apply filters with a single combined mask and one slice
+        mask = np.ones(len(results_df), dtype=bool)
         if selected_team != 'All':
-            filtered_df = filtered_df[filtered_df['owner'] == selected_team]
+            mask &= (results_df['owner'].to_numpy() == selected_team)
         if selected_weight != 'All':
-            filtered_df = filtered_df[filtered_df['weight'] == selected_weight]
-        
-        # Reorder and select columns for display
-        cols_to_display = ['Wrestler', 'weight', 'seed', 'owner', 
-                          'champ_wins', 'champ_advancement', 'champ_bonus',
-                          'cons_wins', 'cons_advancement', 'cons_bonus', 
-                          'placement', 'placement_points', 'total_points']
-        cols_to_display = [col for col in cols_to_display if col in filtered_df.columns]
-        
-        # Rename columns for better display
-        display_df = filtered_df[cols_to_display].copy()
-        display_df = display_df.rename(columns={
-            'Wrestler': 'Wrestler',
-            'weight': 'Weight',
-            'seed': 'Seed',
-            'owner': 'Team',
-            'champ_wins': 'Champ Wins',
-            'champ_advancement': 'Champ Adv Pts',
-            'champ_bonus': 'Champ Bonus Pts',
-            'cons_wins': 'Cons Wins',
-            'cons_advancement': 'Cons Adv Pts',
-            'cons_bonus': 'Cons Bonus Pts',
-            'placement': 'Placement',
-            'placement_points': 'Place Pts',
-            'total_points': 'Total Pts'
-        })
+            mask &= (results_df['weight'].to_numpy() == selected_weight)
+        filtered_df = results_df[mask]
         
+        # Slice the pre-renamed display frame with the same row mask
+        display_df = st.session_state['wrestler_display_df'][mask]
+
         st.dataframe(display_df, use_container_width=True)
         
         # Show match details for selected wrestler
@@ -256,20 +544,21 @@ with tabs[2]:
             
             wrestler_row = filtered_df[filtered_df['Wrestler'] == selected_wrestler].iloc[0]
             if 'matches' in wrestler_row and wrestler_row['matches']:
-                matches_data = []
-                for match in wrestler_row['matches']:
-                    matches_data.append({
-                        'Round': match.get('round', ''),
-                        'Opponent': match.get('opponent', ''),
-                        'Result': match.get('result', ''),
-                        'Type': match.get('win_type_full', ''),
-                        'Advancement': match.get('advancement_points', 0),
-                        'Bonus': match.get('bonus_points', 0),
-                        'Total': match.get('total_points', 0)
-                    })
-                
-                if matches_data:
-                    st.dataframe(pd.DataFrame(matches_data))
+                # Build the frame column-wise - avoids pandas' record-to-columnar
+                # inference over a list of per-match dicts
+                matches = wrestler_row['matches'] or []
+                matches_df = pd.DataFrame({
+                    'Round': [m.get('round', '') for m in matches],
+                    'Opponent': [m.get('opponent', '') for m in matches],
+                    'Result': [m.get('result', '') for m in matches],
+                    'Type': [m.get('win_type_full', '') for m in matches],
+                    'Advancement': [m.get('advancement_points', 0) for m in matches],
+                    'Bonus': [m.get('bonus_points', 0) for m in matches],
+                    'Total': [m.get('total_points', 0) for m in matches]
+                })
+
+                if not matches_df.empty:
+                    st.dataframe(matches_df)
                 else:
                     st.info("No match details available for this wrestler.")
             else:
@@ -277,7 +566,7 @@ with tabs[2]:
     else:
         st.info("No wrestler data available. Please update results.")
 
-with tabs[3]:
+def render_placements():
     st.header("Placements")
     if 'placements_df' in st.session_state and not st.session_state['placements_df'].empty:
         placements_df = st.session_state['placements_df'].copy()
@@ -288,34 +577,21 @@ with tabs[3]:
             st.write(f"First few rows of placements_df:")
             st.write(placements_df.head())
         
-        # Add owner information from results_df
-        if 'results_df' in st.session_state and not st.session_state['results_df'].empty:
-            results_df = st.session_state['results_df'].copy()
-            
-            # Create a map from wrestler details to owner
-            wrestler_to_owner = {}
-            
-            # Based on your data processing code, the key structure appears to be "name (school)"
-            for _, row in results_df.iterrows():
-                # Determine the wrestler identifier based on available columns
-                if 'Wrestler' in results_df.columns:
-                    wrestler_id = row['Wrestler']  # This is already in "name (school)" format in your case
-                    wrestler_to_owner[wrestler_id] = row['owner']
-            
+        # Add owner information using the map prebuilt in load_or_process_data
+        wrestler_to_owner = st.session_state.get('wrestler_to_owner', {})
+        if wrestler_to_owner:
             # Add owner column to placements_df
             if 'Wrestler ID' in placements_df.columns:
                 placements_df['owner'] = placements_df['Wrestler ID'].map(wrestler_to_owner)
             elif 'name' in placements_df.columns and 'school' in placements_df.columns:
                 # Create wrestler ID from separate name and school columns
-                placements_df['wrestler_id'] = placements_df.apply(
-                    lambda row: f"{row['name']} ({row['school']})", axis=1
-                )
+                placements_df['wrestler_id'] = placements_df['name'].astype(str) + ' (' + placements_df['school'].astype(str) + ')'
                 placements_df['owner'] = placements_df['wrestler_id'].map(wrestler_to_owner)
         
         # Add filters - weight class and team owner
         col1, col2 = st.columns(2)
         with col1:
-            weight_classes = ['All'] + sorted(placements_df['weight'].unique().tolist())
+            weight_classes = st.session_state['weight_options_placements']
             selected_weight = st.selectbox("Filter by Weight Class:", weight_classes, key="placement_weight")
         
         with col2:
@@ -327,12 +603,13 @@ with tabs[3]:
                 st.info("Team owner information not available.")
                 selected_owner = 'All'
         
-        # Apply filters
-        filtered_df = placements_df.copy()
+        # Apply filters with a single combined mask and one slice
+        mask = np.ones(len(placements_df), dtype=bool)
         if selected_weight != 'All':
-            filtered_df = filtered_df[filtered_df['weight'] == selected_weight]
-        if selected_owner != 'All' and 'owner' in filtered_df.columns:
-            filtered_df = filtered_df[filtered_df['owner'] == selected_owner]
+            mask &= (placements_df['weight'].to_numpy() == selected_weight)
+        if selected_owner != 'All' and 'owner' in placements_df.columns:
+            mask &= (placements_df['owner'].to_numpy() == selected_owner)
+        filtered_df = placements_df[mask]
         
         # Sort by placement
         if 'placement' in filtered_df.columns:
@@ -436,7 +713,7 @@ with tabs[3]:
 #     st.info("Placement data not available. Please update results first.")
 
 
-with tabs[4]:
+def render_analytics():
     st.header("Advanced Analytics Dashboard")
     st.info("This dashboard is under development. New features will be added over time.")
     
@@ -472,50 +749,13 @@ with tabs[4]:
                 
                 # Sort by total points
                 team_df = team_df.sort_values('total_points', ascending=False)
-                
-                # Create a plotly stacked bar chart
-                fig = go.Figure()
-                
-                # Add advancement points
-                fig.add_trace(go.Bar(
-                    name='Advancement',
-                    x=team_df['owner'],
-                    y=team_df['total_advancement'],
-                    marker_color='#1f77b4',
-                    text=team_df['total_advancement'].round(1),
-                    textposition='auto'
-                ))
-                
-                # Add bonus points
-                fig.add_trace(go.Bar(
-                    name='Bonus',
-                    x=team_df['owner'],
-                    y=team_df['total_bonus'],
-                    marker_color='#ff7f0e',
-                    text=team_df['total_bonus'].round(1),
-                    textposition='auto'
-                ))
-                
-                # Add placement points
-                fig.add_trace(go.Bar(
-                    name='Placement',
-                    x=team_df['owner'],
-                    y=team_df['placement_points'],
-                    marker_color='#2ca02c',
-                    text=team_df['placement_points'].round(1),
-                    textposition='auto'
-                ))
-                
-                # Update layout
-                fig.update_layout(
-                    barmode='stack',
-                    title='Team Points by Category',
-                    xaxis_title='Team',
-                    yaxis_title='Points',
-                    legend_title='Point Category',
-                    height=500
+
+                # Build (or fetch from cache) the stacked bar chart
+                fig = build_points_breakdown(
+                    _df_hash(team_df[['owner', 'total_advancement', 'total_bonus', 'placement_points']]),
+                    team_df
                 )
-                
+
                 # Display the chart
                 st.plotly_chart(fig, use_container_width=True)
             
@@ -534,74 +774,18 @@ with tabs[4]:
                 # Prepare data
                 results_df = st.session_state['results_df'].copy()
                 
-                # Create pivot table of points by team and weight class
-                pivot_data = results_df.pivot_table(
-                    values='total_points',
-                    index='owner',
-                    columns='weight',
-                    aggfunc='sum',
-                    fill_value=0
+                # Create pivot table of points by team and weight class (cached)
+                pivot_data = build_weight_pivot(
+                    _df_hash(results_df[['owner', 'weight', 'total_points']]), results_df
                 )
-                
-                # Ensure weight classes are in correct order
-                weight_order = ['125', '133', '141', '149', '157', '165', '174', '184', '197', '285', 'DH']
-                available_weights = [w for w in weight_order if w in pivot_data.columns]
-                pivot_data = pivot_data[available_weights]
-                
+
                 # Sort teams by total points
                 team_order = st.session_state['team_summary'].sort_values('total_points', ascending=False)['owner'].tolist()
                 pivot_data = pivot_data.reindex(team_order)
                 
-                # Create text matrix with formatted integers
-                text_matrix = []
-                for i in range(len(pivot_data.index)):
-                    text_row = []
-                    for j in range(len(pivot_data.columns)):
-                        text_row.append(str(int(pivot_data.iloc[i, j])))
-                    text_matrix.append(text_row)
-                
-                # Create text color matrix
-                text_color_matrix = []
-                for i in range(len(pivot_data.index)):
-                    color_row = []
-                    for j in range(len(pivot_data.columns)):
-                        value = pivot_data.iloc[i, j]
-                        color_row.append("white" if value == 0 or value >= 15 else "black")
-                    text_color_matrix.append(color_row)
-                
-                # Create the heatmap with built-in text template
-                fig = go.Figure(data=go.Heatmap(
-                    z=pivot_data.values,
-                    x=pivot_data.columns,
-                    y=pivot_data.index,
-                    colorscale=[
-                        [0, 'rgb(220, 53, 69)'],         # Red for zero
-                        [0.001, 'rgb(255, 255, 224)'],   # Light yellow
-                        [0.3, 'rgb(173, 216, 230)'],     # Light blue
-                        [0.6, 'rgb(102, 204, 255)'],     # Medium blue
-                        [1, 'rgb(0, 0, 128)']            # Navy blue
-                    ],
-                    showscale=True,
-                    zmin=0,
-                    text=text_matrix,
-                    texttemplate="%{text}",
-                    textfont={"size": 12}
-                ))
-                
-                # Configure layout
-                fig.update_layout(
-                    title="Points by Team and Weight Class",
-                    height=600,
-                    xaxis=dict(
-                        title="Weight Class",
-                        side="bottom"
-                    ),
-                    yaxis=dict(
-                        title="Team",
-                        autorange="reversed"
-                    )
-                )
-                
+                # Build (or fetch from cache) the heatmap
+                fig = build_weight_heatmap(_df_hash(pivot_data), pivot_data)
+
                 # Display the heatmap
                 st.plotly_chart(fig, use_container_width=True)
                 
@@ -657,17 +841,18 @@ with tabs[4]:
                 
                 # Calculate additional metrics
                 
-                # 1. Points per wrestler
+                # 1. Points per wrestler - eval fuses the arithmetic into a
+                # single pass without intermediate Series allocations
                 team_df['Wrestlers with Points'] = team_df.get('Wrestlers with Points', pd.Series([0] * len(team_df)))
-                team_df['Pts per Wrestler'] = (team_df['total_points'] / team_df['Wrestlers with Points']).fillna(0).round(2)
-                
+                team_df['Pts per Wrestler'] = team_df.eval("total_points / `Wrestlers with Points`").fillna(0).round(2)
+
                 # 2. Bonus point efficiency (% of points from bonus)
-                team_df['Bonus %'] = (team_df['total_bonus'] / team_df['total_points'] * 100).fillna(0).round(1)
+                team_df['Bonus %'] = team_df.eval("total_bonus / total_points * 100").fillna(0).round(1)
                 
                 # 3. Calculate All-Americans (wrestlers who placed in top 8)
                 if 'placement' in results_df.columns:
-                    all_americans = results_df[results_df['placement'].notna()].groupby('owner').size()
-                    team_df['All-Americans'] = team_df.index.map(lambda x: all_americans.get(x, 0) if x in all_americans.index else 0)
+                    _, aa_counts = compute_all_americans(_df_hash(results_df[['owner', 'placement']]), results_df)
+                    team_df['All-Americans'] = aa_counts.reindex(team_df.index, fill_value=0).to_numpy()
                 else:
                     team_df['All-Americans'] = 0
                 
@@ -714,14 +899,6 @@ with tabs[4]:
             # Add this to your Efficiency Rankings section
             # Under the bubble chart for efficiency metrics
 
-            # Helper function for ordinal suffixes
-            def get_placement_suffix(n):
-                if 10 <= n % 100 <= 20:
-                    return 'th'
-                else:
-                    suffix = {1: 'st', 2: 'nd', 3: 'rd'}.get(n % 10, 'th')
-                return suffix
-
             st.subheader("All-Americans by Team")
 
             try:
@@ -731,119 +908,44 @@ with tabs[4]:
                     
                     # Count All-Americans (wrestlers who placed in top 8) by team
                     if 'placement' in results_df.columns:
-                        # Filter to only include wrestlers who placed in top 8
-                        all_americans_df = results_df[
-                            results_df['placement'].notna() & 
-                            (results_df['placement'] <= 8)
-                        ]
-                        
-                        # Create a categorical placement column
-                        def get_placement_category(placement):
-                            if placement == 1:
-                                return "Champion (1st)"
-                            elif placement == 2:
-                                return "Runner-up (2nd)"
-                            elif placement == 3:
-                                return "Third Place (3rd)"
-                            elif placement <= 8:
-                                return f"Placed ({int(placement)}th)"
-                            else:
-                                return "Other"
-                        
-                        all_americans_df['placement_category'] = all_americans_df['placement'].apply(get_placement_category)
-                        
-                        # Define the order for placement categories
-                        placement_order = ["Champion (1st)", "Runner-up (2nd)", "Third Place (3rd)", "Placed (4th)", 
-                                        "Placed (5th)", "Placed (6th)", "Placed (7th)", "Placed (8th)"]
-                        
-                        # Add a constant column for counting
-                        all_americans_df['count'] = 1
-                        
-                        # Sort weight classes for proper ordering within stacks
-                        weight_order = ['125', '133', '141', '149', '157', '165', '174', '184', '197', '285']
-                        all_americans_df['weight_order'] = all_americans_df['weight'].apply(
-                            lambda w: weight_order.index(w) if w in weight_order else 999
-                        )
-                        all_americans_df = all_americans_df.sort_values(['owner', 'weight_order'])
-                        
-                        # Count All-Americans by team for sorting
-                        aa_by_team = all_americans_df.groupby('owner').size().reset_index(name='total_aa')
-                        aa_by_team = aa_by_team.sort_values('total_aa', ascending=False)
-                        
-                        # Create horizontal bar chart with color coding by placement
-                        fig = px.bar(
-                            all_americans_df,
-                            y='owner',
-                            x='count',  # Now using the count column
-                            color='placement_category',
-                            category_orders={
-                                "owner": aa_by_team['owner'].tolist(),
-                                "placement_category": placement_order
-                            },
-                            labels={
-                                'owner': 'Team',
-                                'count': 'All-Americans',
-                                'placement_category': 'Placement'
-                            },
-                            title='All-Americans Distribution by Placement',
-                            orientation='h',
-                            hover_name='Wrestler',
-                            hover_data={
-                                'weight': True,
-                                'placement': True,
-                                'placement_category': False,
-                                'owner': False,
-                                'count': False
-                            },
-                            custom_data=['Wrestler', 'weight', 'placement']
-                        )
-                        
-                        # Custom color scheme - gold, silver, bronze, and other colors for the rest
-                        colors = {
-                            "Champion (1st)": '#FFD700',     # Gold for champions
-                            "Runner-up (2nd)": '#C0C0C0',    # Silver for runners-up
-                            "Third Place (3rd)": '#CD7F32',  # Bronze for third
-                            "Placed (4th)": '#1E90FF',       # Blue for 4th
-                            "Placed (5th)": '#32CD32',       # Green for 5th
-                            "Placed (6th)": '#9370DB',       # Purple for 6th
-                            "Placed (7th)": '#FF6347',       # Tomato for 7th
-                            "Placed (8th)": '#20B2AA'        # Light sea green for 8th
+                        # Reuse the cached top-8 filter from the efficiency section
+                        all_americans_df, _ = compute_all_americans(_df_hash(results_df[['owner', 'placement']]), results_df)
+
+                        # Create a categorical placement column via one vectorized dict map
+                        placement_categories = {
+                            1: "Champion (1st)",
+                            2: "Runner-up (2nd)",
+                            3: "Third Place (3rd)",
+                            4: "Placed (4th)",
+                            5: "Placed (5th)",
+                            6: "Placed (6th)",
+                            7: "Placed (7th)",
+                            8: "Placed (8th)"
                         }
-                        
-                        # Update the color for each trace
-                        for i, trace in enumerate(fig.data):
-                            if trace.name in colors:
-                                fig.data[i].marker.color = colors[trace.name]
-                        
-                        # Update layout
-                        fig.update_layout(
-                            height=500,
-                            barmode='stack',
-                            yaxis={'categoryorder': 'total ascending'},
-                            legend_title_text='Placement',
-                            hovermode='closest'
+                        # Ordered categorical so the groupby/sort in the chart
+                        # build runs on int8 codes instead of object strings
+                        # (owner is already categorical from _shrink_frames)
+                        all_americans_df['placement_category'] = pd.Categorical(
+                            all_americans_df['placement'].astype(int).map(placement_categories),
+                            categories=list(placement_categories.values()),
+                            ordered=True
                         )
-                        
-                        # Add annotations with total counts at the end of each bar
-                        for team in aa_by_team['owner'].unique():
-                            total = aa_by_team[aa_by_team['owner'] == team]['total_aa'].values[0]
-                            fig.add_annotation(
-                                x=total + 0.1,  # Position annotation just past the end of the bar
-                                y=team,
-                                text=f"{total}",
-                                showarrow=False,
-                                font=dict(size=12)
-                            )
-                        
-                        # Improve hover template to show wrestler name, school, weight, and placement
-                        for i, trace in enumerate(fig.data):
-                            placement_text = trace.name
-                            if "(" in placement_text and ")" in placement_text:
-                                placement_str = placement_text.split('(')[1].split(')')[0]
-                                placement_num = int(placement_str.replace('th', '').replace('st', '').replace('nd', '').replace('rd', ''))
-                                suffix = get_placement_suffix(placement_num)
-                                fig.data[i].hovertemplate = f'<b>%{{customdata[0]}}</b><br>Weight: %{{customdata[1]}}<br>Placement: {placement_num}{suffix}<extra></extra>'
-                        
+
+
+                        # Sort weight classes for proper ordering within stacks
+                        weight_order = _WEIGHT_ORDER[:10]  # championship weights only, no 'DH'
+                        all_americans_df['weight_order'] = all_americans_df['weight'].map(
+                            {w: i for i, w in enumerate(weight_order)}
+                        ).fillna(999)
+                        all_americans_df = all_americans_df.sort_values(['owner', 'weight_order'])
+
+                        # Count All-Americans by team for sorting (cached)
+                        aa_hash = _df_hash(all_americans_df[['owner', 'Wrestler', 'weight', 'placement']])
+                        aa_by_team = _aa_by_team(aa_hash, all_americans_df)
+
+                        # Build (or fetch from cache) the distribution chart
+                        fig = _build_aa_figure(aa_hash, all_americans_df, aa_by_team)
+
                         # Display the chart
                         st.plotly_chart(fig, use_container_width=True)
                         
@@ -865,6 +967,16 @@ with tabs[4]:
                 st.error(traceback.format_exc())
 
 
+# Render only the selected view
+_RENDERERS = {
+    "Team Standings": render_team_standings,
+    "Round-by-Round": render_round_by_round,
+    "Wrestler Details": render_wrestler_details,
+    "Placements": render_placements,
+    "Analytics (Beta)": render_analytics,
+}
+_RENDERERS[active_tab]()
+
 # Footer
 st.markdown("---")
 st.markdown("Currently in Development - Created by Demetri D'Orsaneo")
\ No newline at end of file
@@ -3,9 +3,14 @@ Configuration settings for the NCAA Wrestling Tournament Draft Tracker
 """
 import os
 import datetime
+import numpy as np
 
-# Set base file paths - updated for new structure
-PROJECT_ROOT = r"C:\Users\Admin\Documents\Python Projects\ncaa-wrestling-draft-tracker-beta"
+# Set base file paths - overridable via NCAA_TRACKER_ROOT, defaulting to the
+# repository root so imports work on any machine without editing this file
+PROJECT_ROOT = os.environ.get(
+    'NCAA_TRACKER_ROOT',
+    os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+)
 DATA_PATH = os.path.join(PROJECT_ROOT, "Data")
 RESULTS_FILE = os.path.join(DATA_PATH, "wrestling_results.txt")
 DRAFT_CSV = os.path.join(DATA_PATH, "ncaa_wrestling_draft.csv")
@@ -13,24 +18,49 @@ DRAFT_CSV = os.path.join(DATA_PATH, "ncaa_wrestling_draft.csv")
 # Enable debugging output
 DEBUG_MODE = True
 
-# Create Results folder with timestamped subfolders
+# Results folder with timestamped subfolders - created lazily by
+# ensure_output_dir() so importing config does no disk I/O
 RESULTS_BASE = os.path.join(PROJECT_ROOT, "Results")
-if not os.path.exists(RESULTS_BASE):
-    os.makedirs(RESULTS_BASE)
-    
-timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-OUTPUT_DIR = os.path.join(RESULTS_BASE, timestamp)
-if not os.path.exists(OUTPUT_DIR):
-    os.makedirs(OUTPUT_DIR)
-# Output file paths
-OUTPUT_WRESTLER_CSV = os.path.join(OUTPUT_DIR, "wrestler_results.csv")
-OUTPUT_TEAM_CSV = os.path.join(OUTPUT_DIR, "team_standings.csv")
-OUTPUT_REPORT = os.path.join(OUTPUT_DIR, "tournament_report.txt")
-OUTPUT_DEBUG = os.path.join(OUTPUT_DIR, "debug_log.txt")
-OUTPUT_MISMATCHES = os.path.join(OUTPUT_DIR, "mismatched_wrestlers.csv")
-OUTPUT_ROUND_SUMMARY = os.path.join(OUTPUT_DIR, "round_by_round_summary.csv")
-OUTPUT_PROBLEM_CASES = os.path.join(OUTPUT_DIR, "problem_cases.txt")
-OUTPUT_PLACEMENTS = os.path.join(OUTPUT_DIR, "wrestler_placements.csv")
+
+# Output directory and file paths - populated by ensure_output_dir()
+OUTPUT_DIR = None
+OUTPUT_WRESTLER_CSV = None
+OUTPUT_TEAM_CSV = None
+OUTPUT_REPORT = None
+OUTPUT_DEBUG = None
+OUTPUT_MISMATCHES = None
+OUTPUT_ROUND_SUMMARY = None
+OUTPUT_PROBLEM_CASES = None
+OUTPUT_PLACEMENTS = None
+
+
+def _set_output_paths():
+    """Recompute the output file paths from the current OUTPUT_DIR"""
+    global OUTPUT_WRESTLER_CSV, OUTPUT_TEAM_CSV, OUTPUT_REPORT, OUTPUT_DEBUG
+    global OUTPUT_MISMATCHES, OUTPUT_ROUND_SUMMARY, OUTPUT_PROBLEM_CASES, OUTPUT_PLACEMENTS
+    OUTPUT_WRESTLER_CSV = os.path.join(OUTPUT_DIR, "wrestler_results.csv")
+    OUTPUT_TEAM_CSV = os.path.join(OUTPUT_DIR, "team_standings.csv")
+    OUTPUT_REPORT = os.path.join(OUTPUT_DIR, "tournament_report.txt")
+    OUTPUT_DEBUG = os.path.join(OUTPUT_DIR, "debug_log.txt")
+    OUTPUT_MISMATCHES = os.path.join(OUTPUT_DIR, "mismatched_wrestlers.csv")
+    OUTPUT_ROUND_SUMMARY = os.path.join(OUTPUT_DIR, "round_by_round_summary.csv")
+    OUTPUT_PROBLEM_CASES = os.path.join(OUTPUT_DIR, "problem_cases.txt")
+    OUTPUT_PLACEMENTS = os.path.join(OUTPUT_DIR, "wrestler_placements.csv")
+
+
+def ensure_output_dir() -> str:
+    """
+    Create the output directory on first use and set the output file paths.
+    Defaults to a fresh timestamped subfolder of RESULTS_BASE unless a caller
+    has already pointed OUTPUT_DIR somewhere else.
+    """
+    global OUTPUT_DIR
+    if OUTPUT_DIR is None:
+        timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        OUTPUT_DIR = os.path.join(RESULTS_BASE, timestamp)
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    _set_output_paths()
+    return OUTPUT_DIR
 
 # Define problematic wrestlers to watch
 PROBLEM_WRESTLERS = [
@@ -50,6 +80,12 @@ PLACEMENT_POINTS = {
     8: 3     # 8th place
 }
 
+# Same table as a NumPy lookup array (index = placement, 0 = unplaced) so
+# placement-to-points mapping can be a single indexed gather
+PLACEMENT_POINTS_ARR = np.zeros(9, dtype=np.int8)
+for _place, _points in PLACEMENT_POINTS.items():
+    PLACEMENT_POINTS_ARR[_place] = _points
+
 # School name standardization mapping
 SCHOOL_MAPPINGS = {
     'virginia tech': 'virginia tech',
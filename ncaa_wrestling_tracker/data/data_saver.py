@@ -1,10 +1,19 @@
 """
 Data saving functions for the NCAA Wrestling Tournament Tracker
 """
+import os
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 from ncaa_wrestling_tracker import config
 
 
+def _write_csv(df: pd.DataFrame, path: str) -> None:
+    """Write a DataFrame through pyarrow's C-vectorized CSV writer"""
+    pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), path)
+
+
 def save_results_to_csv(results_df: pd.DataFrame, team_summary_df: pd.DataFrame, 
                         round_df: pd.DataFrame, placements_df: pd.DataFrame) -> None:
     """
@@ -16,23 +25,24 @@ def save_results_to_csv(results_df: pd.DataFrame, team_summary_df: pd.DataFrame,
         round_df: DataFrame with round-by-round results
         placements_df: DataFrame with wrestler placements
     """
-    # Save wrestler results - drop the matches column which contains lists
-    results_df_export = results_df.copy()
-    if 'matches' in results_df_export.columns:
-        results_df_export = results_df_export.drop('matches', axis=1)
-    results_df_export.to_csv(config.OUTPUT_WRESTLER_CSV, index=False)
+    # Save wrestler results - drop the matches column which contains lists;
+    # drop() already returns a new frame, so no up-front full copy is needed
+    results_df_export = results_df.drop(columns='matches', errors='ignore')
+    # The four writes are independent and I/O-bound, so overlap them in a
+    # small thread pool; pyarrow's writer releases the GIL
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(_write_csv, results_df_export, config.OUTPUT_WRESTLER_CSV),
+            executor.submit(_write_csv, team_summary_df, config.OUTPUT_TEAM_CSV),
+            executor.submit(_write_csv, round_df, config.OUTPUT_ROUND_SUMMARY),
+            executor.submit(_write_csv, placements_df, config.OUTPUT_PLACEMENTS),
+        ]
+        for future in futures:
+            future.result()
+
     print(f"Saved wrestler results to {config.OUTPUT_WRESTLER_CSV}")
-    
-    # Save team standings
-    team_summary_df.to_csv(config.OUTPUT_TEAM_CSV, index=False)
     print(f"Saved team standings to {config.OUTPUT_TEAM_CSV}")
-    
-    # Save round-by-round summary
-    round_df.to_csv(config.OUTPUT_ROUND_SUMMARY, index=False)
     print(f"Saved round-by-round summary to {config.OUTPUT_ROUND_SUMMARY}")
-    
-    # Save placements
-    placements_df.to_csv(config.OUTPUT_PLACEMENTS, index=False)
     print(f"Saved wrestler placements to {config.OUTPUT_PLACEMENTS}")
 
 
@@ -43,8 +53,14 @@ def save_text_report(report_text: str) -> None:
     Args:
         report_text: Text report to save
     """
-    with open(config.OUTPUT_REPORT, "w") as f:
-        f.write(report_text)
+    # Encode once and write the bytes in a single unbuffered call instead of
+    # streaming through the text-mode encode/buffer layer
+    data = report_text.encode('utf-8')
+    fd = os.open(config.OUTPUT_REPORT, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
     print(f"Saved detailed report to {config.OUTPUT_REPORT}")
 
 
@@ -56,5 +72,5 @@ def save_mismatches(mismatches: list) -> None:
         mismatches: List of dictionaries with mismatch information
     """
     if mismatches:
-        pd.DataFrame(mismatches).to_csv(config.OUTPUT_MISMATCHES, index=False)
+        _write_csv(pd.DataFrame(mismatches), config.OUTPUT_MISMATCHES)
         print(f"Saved {len(mismatches)} mismatched wrestlers to {config.OUTPUT_MISMATCHES}")
\ No newline at end of file
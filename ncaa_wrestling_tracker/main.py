@@ -9,7 +9,7 @@ from ncaa_wrestling_tracker import config
 from ncaa_wrestling_tracker.utils.logging_utils import log_debug, log_problem, save_debug_log, save_problem_cases
 from ncaa_wrestling_tracker.utils.file_utils import create_output_directory, save_input_copy, save_draft_copy, create_readme
 from ncaa_wrestling_tracker.data.data_loader import load_draft_data, load_results_text, validate_input_files
-from ncaa_wrestling_tracker.data.data_saver import save_results_to_csv, save_text_report, save_mismatches
+from ncaa_wrestling_tracker.data.data_saver import save_results_to_csv, save_mismatches
 from ncaa_wrestling_tracker.processors.wrestler_matcher import build_wrestler_lookup
 from ncaa_wrestling_tracker.processors.results_processor import parse_wrestling_results
 from ncaa_wrestling_tracker.processors.scorer import calculate_team_points
@@ -50,12 +50,12 @@ def main(return_results=False):
         return (pd.DataFrame(), pd.DataFrame(), pd.DataFrame()) if return_results else None
     
     # Build the wrestler lookup tables
-    wrestler_lookup, weight_seed_lookup, all_wrestlers, problem_wrestler_info = build_wrestler_lookup(drafted_wrestlers)
-    
+    wrestler_lookup, weight_seed_lookup, all_wrestlers, problem_index, override_index = build_wrestler_lookup(drafted_wrestlers)
+
     # Parse results and calculate points
     try:
         results_df, round_df, placements_df = parse_wrestling_results(
-            results_text, drafted_wrestlers, wrestler_lookup, weight_seed_lookup, all_wrestlers, problem_wrestler_info
+            results_text, drafted_wrestlers, wrestler_lookup, weight_seed_lookup, all_wrestlers, problem_index, override_index
         )
         print(f"Successfully processed results for {len(results_df)} wrestlers")
     except Exception as e:
@@ -67,10 +67,12 @@ def main(return_results=False):
     # Calculate team points
     team_summary = calculate_team_points(results_df)
     
-    # Generate detailed report
+    # Generate detailed report, streamed straight to disk so the full text
+    # never has to exist as one in-memory string
     try:
-        report = generate_detailed_report(results_df, team_summary, config.RESULTS_FILE)
-        save_text_report(report)
+        with open(config.OUTPUT_REPORT, 'w', buffering=1 << 20, encoding='utf-8') as report_out:
+            generate_detailed_report(results_df, team_summary, config.RESULTS_FILE, out=report_out)
+        print(f"Saved detailed report to {config.OUTPUT_REPORT}")
     except Exception as e:
         print(f"Error generating report: {e}")
         return (results_df, round_df, placements_df) if return_results else None
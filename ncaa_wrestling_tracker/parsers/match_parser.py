@@ -1,73 +1,195 @@
 """
 Match parsing functionality for the NCAA Wrestling Tournament Tracker
 """
+import functools
 import re
+import sys
+from collections import namedtuple
+from dataclasses import dataclass
 from typing import Optional, Dict, Any, Tuple
 from ncaa_wrestling_tracker import config
 from ncaa_wrestling_tracker.utils.logging_utils import log_debug, log_problem
+# Canonical definition lives in placement_parser; re-exported here so
+# existing imports from match_parser keep working
+from ncaa_wrestling_tracker.parsers.placement_parser import parse_placement_line
 
 
+# Round metadata as an immutable namedtuple - attribute access is a
+# C-level index instead of a hashed dict lookup per field
+RoundInfo = namedtuple("RoundInfo", "bracket round_num full_round advancement_points")
+
 # Define a mapping of round names to standardized information
 ROUND_MAPPING = {
     # Preliminary rounds
-    "Prelim": {"bracket": "Champ", "round_num": 0, "full_round": "Prelim", "advancement_points": 1.0},
-    "Pig Tails": {"bracket": "Champ", "round_num": 0, "full_round": "Pig Tails", "advancement_points": 1.0},
+    "Prelim": RoundInfo("Champ", 0, "Prelim", 1.0),
+    "Pig Tails": RoundInfo("Champ", 0, "Pig Tails", 1.0),
     
     # Championship bracket rounds
-    "Champ. Round 1": {"bracket": "Champ", "round_num": 1, "full_round": "Champ. R1", "advancement_points": 1.0},
-    "Champ Round 1": {"bracket": "Champ", "round_num": 1, "full_round": "Champ. R1", "advancement_points": 1.0},
-    "Champ. Round 2": {"bracket": "Champ", "round_num": 2, "full_round": "Champ. R2", "advancement_points": 1.0},
-    "Champ Round 2": {"bracket": "Champ", "round_num": 2, "full_round": "Champ. R2", "advancement_points": 1.0},
-    "Quarterfinal": {"bracket": "Champ", "round_num": 3, "full_round": "Quarters", "advancement_points": 1.0},
-    "Semifinal": {"bracket": "Champ", "round_num": 4, "full_round": "Semis", "advancement_points": 1.0},
-    "1st Place Match": {"bracket": "Champ", "round_num": 5, "full_round": "Finals", "advancement_points": 0.0},  # No advancement points for finals
-    "Championships": {"bracket": "Champ", "round_num": 5, "full_round": "Finals", "advancement_points": 0.0},
+    "Champ. Round 1": RoundInfo("Champ", 1, "Champ. R1", 1.0),
+    "Champ Round 1": RoundInfo("Champ", 1, "Champ. R1", 1.0),
+    "Champ. Round 2": RoundInfo("Champ", 2, "Champ. R2", 1.0),
+    "Champ Round 2": RoundInfo("Champ", 2, "Champ. R2", 1.0),
+    "Quarterfinal": RoundInfo("Champ", 3, "Quarters", 1.0),
+    "Semifinal": RoundInfo("Champ", 4, "Semis", 1.0),
+    "1st Place Match": RoundInfo("Champ", 5, "Finals", 0.0),  # No advancement points for finals
+    "Championships": RoundInfo("Champ", 5, "Finals", 0.0),
     
     # Consolation bracket rounds
-    "Consolation Pig Tails": {"bracket": "Cons", "round_num": 0, "full_round": "Cons. Pig Tails", "advancement_points": 0.5},
-    "Cons. Pig Tails": {"bracket": "Cons", "round_num": 0, "full_round": "Cons. Pig Tails", "advancement_points": 0.5},
-    "Cons. Round 1": {"bracket": "Cons", "round_num": 1, "full_round": "Cons. R1", "advancement_points": 0.5},
-    "Cons. Round 2": {"bracket": "Cons", "round_num": 2, "full_round": "Cons. R2", "advancement_points": 0.5},
-    "Cons. Round 3": {"bracket": "Cons", "round_num": 3, "full_round": "Cons. R3", "advancement_points": 0.5},
-    "Cons. Round 4": {"bracket": "Cons", "round_num": 4, "full_round": "Cons. R4", "advancement_points": 0.5},
-    "Cons. Round 5": {"bracket": "Cons", "round_num": 5, "full_round": "Cons. R5", "advancement_points": 0.5},
-    "Cons. Semi": {"bracket": "Cons", "round_num": 6, "full_round": "Cons. Semis", "advancement_points": 0.5},
-    "Cons. Semis": {"bracket": "Cons", "round_num": 6, "full_round": "Cons. Semis", "advancement_points": 0.5},
-    "Cons. Semis (32 Man)": {"bracket": "Cons", "round_num": 6, "full_round": "Cons. Semis", "advancement_points": 0.5},
+    "Consolation Pig Tails": RoundInfo("Cons", 0, "Cons. Pig Tails", 0.5),
+    "Cons. Pig Tails": RoundInfo("Cons", 0, "Cons. Pig Tails", 0.5),
+    "Cons. Round 1": RoundInfo("Cons", 1, "Cons. R1", 0.5),
+    "Cons. Round 2": RoundInfo("Cons", 2, "Cons. R2", 0.5),
+    "Cons. Round 3": RoundInfo("Cons", 3, "Cons. R3", 0.5),
+    "Cons. Round 4": RoundInfo("Cons", 4, "Cons. R4", 0.5),
+    "Cons. Round 5": RoundInfo("Cons", 5, "Cons. R5", 0.5),
+    "Cons. Semi": RoundInfo("Cons", 6, "Cons. Semis", 0.5),
+    "Cons. Semis": RoundInfo("Cons", 6, "Cons. Semis", 0.5),
+    "Cons. Semis (32 Man)": RoundInfo("Cons", 6, "Cons. Semis", 0.5),
     
     # Placement matches
-    "3rd Place Match": {"bracket": "Place", "round_num": 7, "full_round": "3rd Place", "advancement_points": 0.0},
-    "5th Place Match": {"bracket": "Place", "round_num": 7, "full_round": "5th Place", "advancement_points": 0.0},
-    "7th Place Match": {"bracket": "Place", "round_num": 7, "full_round": "7th Place", "advancement_points": 0.0}
+    "3rd Place Match": RoundInfo("Place", 7, "3rd Place", 0.0),
+    "5th Place Match": RoundInfo("Place", 7, "5th Place", 0.0),
+    "7th Place Match": RoundInfo("Place", 7, "7th Place", 0.0)
 }
 
-# Keep track of section headers to handle prelims correctly
-current_section = None
+# Precompiled patterns for the parsing hot loop - avoids the per-call
+# re-cache lookup that re.search with a string literal incurs. The match
+# pattern also captures the optional winner record/seed so one scan covers
+# what used to take a second seed-pattern search.
+_MATCH_RE = re.compile(
+    r"[^-]*-\s*(?P<wname>\S(?:[^()]*\S)?)\s+\((?P<wschool>\S(?:[^()]*\S)?)\)"
+    r"(?:\s+\d+-\d+(?:\s+\(#(?P<seed>\d+)\))?)?"
+    r"(?:.*?)won\s+(?:by|in)\s+(?P<wt>.*?)\s+over\s+(?P<lname>\S(?:[^()]*\S)?)\s+\((?P<lschool>\S(?:[^()]*\S)?)\)(?P<rest>.*)"
+)
+# SV-1/TB-1 score tags, either parenthesized or space-delimited
+_SVTB_RE = re.compile(r"\((SV|TB)-1| (SV|TB)-1 ")
+_PLACE_NUM_RE = re.compile(r"(\d+)(st|nd|rd|th) Place Match")
+_WINTYPE_EXTRACT_RE = re.compile(r"won (?:by|in) (.*?) over")
+_WEIGHT_RE = re.compile(r"^(125|133|141|149|157|165|174|184|197|285|DH)$")
+_LINE_RE = re.compile(r"[^\n]+")
+
+# Single alternation over all round names (longest first so e.g.
+# "Cons. Semis" beats "Cons. Semi") - one C-level scan per line instead of
+# ~20 Python substring checks
+_ROUND_KEYS = sorted(ROUND_MAPPING, key=len, reverse=True)
+_ROUND_RE = re.compile("|".join(f"(?P<k{i}>{re.escape(k)})" for i, k in enumerate(_ROUND_KEYS)))
+_GROUP_TO_INFO = {f"k{i}": ROUND_MAPPING[k] for i, k in enumerate(_ROUND_KEYS)}
+
+# All problem-wrestler names as one case-insensitive alternation - one
+# C-level pass per line with no lowercase copy allocated
+_PROBLEM_RE = re.compile("|".join(re.escape(w) for w in config.PROBLEM_WRESTLERS), re.IGNORECASE)
 
+# Win-type detection as one alternation plus a dict dispatch - longer
+# phrases come first so "tech fall" and "major decision" win over their
+# substrings, matching the old if/elif precedence
+_WIN_RE = re.compile(
+    r"tech fall|major decision|sudden victory|tie breaker|fall|pin|default|forfeit|disqualification|misconduct|decision",
+    re.IGNORECASE
+)
+_WIN_MAP = {
+    "tech fall": ("TF", 1.5),
+    "major decision": ("MD", 1.0),
+    "fall": ("Fall", 2.0),
+    "pin": ("Fall", 2.0),
+    "default": ("Def/DQ", 2.0),
+    "forfeit": ("Def/DQ", 2.0),
+    "disqualification": ("Def/DQ", 2.0),
+    "misconduct": ("Def/DQ", 2.0),
+    "sudden victory": ("SV", 0.0),
+    "tie breaker": ("TB", 0.0),
+    "decision": ("Dec", 0.0),
+}
+# Fallback patterns scanned over the full match text when the win-type
+# phrase itself is unrecognized
+_SV_FALLBACK_RE = re.compile(r"sudden victory| SV-1 | SV-2 |\(SV-1")
+_TB_FALLBACK_RE = re.compile(r"tie breaker| TB-1 | TB-2 |\(TB-1")
+
+# Winner/loser placements per placement match as a jump table instead of
+# an if/elif ladder
+_PLACEMENT_PAIRS = {1: (1, 2), 3: (3, 4), 5: (5, 6), 7: (7, 8)}
 
-def parse_match_result(match_text: str, current_weight: Optional[str] = None, 
-                      section_header: Optional[str] = None) -> Optional[Dict[str, Any]]:
+@dataclass(slots=True)
+class MatchResult:
+    """
+    A parsed match. Slotted fields keep per-match memory well below a
+    15-key dict; dict-style access (getitem/get/contains) is provided so
+    existing consumers keep working. A field that is None counts as
+    absent, mirroring the keys the old dicts left out.
+    """
+    is_placement_match: bool = False
+    bracket: Optional[str] = None
+    round_num: Optional[int] = None
+    full_round: Optional[str] = None
+    placement_match: Optional[str] = None
+    winner_name: Optional[str] = None
+    winner_school: Optional[str] = None
+    winner_placement: Optional[int] = None
+    winner_seed: Optional[str] = None
+    winner_seed_num: Optional[int] = None
+    loser_name: Optional[str] = None
+    loser_school: Optional[str] = None
+    loser_placement: Optional[int] = None
+    weight: Optional[str] = None
+    win_type: Optional[str] = None
+    win_type_full: Optional[str] = None
+    advancement_points: float = 0.0
+    bonus_points: float = 0.0
+    total_points: float = 0.0
+    match_text: Optional[str] = None
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+    def __contains__(self, key):
+        return getattr(self, key, None) is not None
+
+
+@dataclass
+class ParserState:
+    """Per-run parse state (the section header carried between lines),
+    threaded through calls instead of living in a module-level global"""
+    current_section: Optional[str] = None
+
+
+def parse_match_result(match_text: str, current_weight: Optional[str] = None,
+                      section_header: Optional[str] = None,
+                      state: Optional[ParserState] = None) -> Optional[MatchResult]:
     """
     Parse a single match result text and extract relevant information.
-    
+
     Args:
         match_text: Text describing a match result
         current_weight: Current weight class being processed
         section_header: Current section header (round type) being processed
-        
+        state: Parse-run state; a fresh one is used if not provided
+
     Returns:
-        Dictionary with match information or None if parsing fails
+        MatchResult with match information or None if parsing fails
     """
-    global current_section
-    
+    if state is None:
+        state = ParserState()
+
     # Update current section if a new one is provided
     if section_header:
-        current_section = section_header
-    
-    # Check if any problematic wrestler is in this line first
-    for wrestler in config.PROBLEM_WRESTLERS:
-        if wrestler.lower() in match_text.lower():
-            log_problem(f"Found problem wrestler match: {match_text}")
+        state.current_section = section_header
+
+    return _parse_cached(match_text, current_weight, state.current_section)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_cached(match_text: str, current_weight: Optional[str],
+                  current_section: Optional[str]) -> Optional[MatchResult]:
+    """Memoized parse body - repeated lines (re-ingested pages, reruns over
+    overlapping input) skip the regex pipeline. Callers treat the returned
+    match as read-only."""
+    # Check if any problematic wrestler is in this line first - log once
+    # per distinct name found, as the old per-name loop did
+    matched_names = {m.group(0).lower() for m in _PROBLEM_RE.finditer(match_text)}
+    for _ in matched_names:
+        log_problem(f"Found problem wrestler match: {match_text}")
     
     # Special handling for prelim matches based on section
     if match_text.startswith("Prelim -"):
@@ -78,15 +200,13 @@ def parse_match_result(match_text: str, current_weight: Optional[str] = None,
             # This is a championship prelim
             round_info = ROUND_MAPPING["Prelim"]
         
-        log_debug(f"Prelim match in section '{current_section}', assigned to {round_info['bracket']} bracket")
+        log_debug(f"Prelim match in section '{current_section}', assigned to {round_info.bracket} bracket")
     else:
-        # Try to determine the round type
-        round_info = None
-        for round_name, info in ROUND_MAPPING.items():
-            if round_name in match_text or match_text.startswith(round_name):
-                round_info = info
-                break
-        
+        # Try to determine the round type with one scan of the alternation
+        round_match = _ROUND_RE.search(match_text)
+        round_info = _GROUP_TO_INFO[round_match.lastgroup] if round_match else None
+
+
         # Use section header as fallback
         if not round_info and current_section and current_section in ROUND_MAPPING:
             round_info = ROUND_MAPPING[current_section]
@@ -108,8 +228,50 @@ def parse_match_result(match_text: str, current_weight: Optional[str] = None,
         return None
 
 
+# Reset hook so a new tournament's parse can start from a cold cache
+parse_match_result.cache_clear = _parse_cached.cache_clear
+
+
+def parse_all_matches(results_text: str):
+    """
+    Parse every match in a results dump in one pass over the buffer.
+
+    Iterates line spans with finditer (no per-line list is materialized),
+    tracks the weight class and section header inline, and yields a
+    MatchResult for each line that parses as a match. Lines that are
+    headers, placements or noise are skipped.
+
+    Args:
+        results_text: Full text of tournament results
+
+    Yields:
+        MatchResult for each parsed match, in document order
+    """
+    state = ParserState()
+    current_weight = None
+    for line_span in _LINE_RE.finditer(results_text):
+        line = line_span.group(0).strip()
+        if not line:
+            continue
+
+        # Weight class indicator
+        if _WEIGHT_RE.match(line):
+            current_weight = line
+            continue
+
+        # Section header: hyphen-free line naming a known round type
+        if '-' not in line:
+            if _ROUND_RE.search(line):
+                state.current_section = line
+            continue
+
+        result = _parse_cached(line, current_weight, state.current_section)
+        if result:
+            yield result
+
+
 def _parse_match_with_pattern(match_text: str, current_weight: Optional[str], 
-                             round_info: Optional[Dict], is_placement_match: bool) -> Optional[Dict[str, Any]]:
+                             round_info: Optional[RoundInfo], is_placement_match: bool) -> Optional[MatchResult]:
     """
     Parse a match with a flexible pattern that works for various round formats
     
@@ -120,87 +282,73 @@ def _parse_match_with_pattern(match_text: str, current_weight: Optional[str],
         is_placement_match: Whether this is a placement match
         
     Returns:
-        Match information dictionary or None if parsing fails
+        MatchResult or None if parsing fails
     """
-    # Generic pattern that works for all round formats
-    pattern = r"(?:.*?)(?:\s*-\s*)(.*?)\s+\((.*?)\)(?:.*?)won\s+(?:by|in)\s+(.*?)\s+over\s+(.*?)\s+\((.*?)\)(.*)"
-    
-    match = re.search(pattern, match_text)
+    # Cheap substring gate: every parseable line contains "won", so headers,
+    # scores and placement lines skip the backtracking regex entirely
+    if "won" not in match_text:
+        return None
+
+    # Generic pattern that works for all round formats - anchored at the
+    # start of the line, so the engine never retries from later offsets
+    match = _MATCH_RE.match(match_text)
     if not match:
         return None
     
-    winner_name = match.group(1).strip()
-    winner_school = match.group(2).strip()
-    win_type_full = match.group(3).strip()
-    loser_name = match.group(4).strip()
-    loser_school = match.group(5).strip()
-    
-    # Extract seed info from the match text if available
-    winner_seed = None
-    winner_seed_num = None
-    
-    # Look for seed pattern in the match text (after the wrestler's name)
-    seed_pattern = r"\(.*?\)\s+(\d+)-\d+\s+(?:\(#(\d+)\))?"
-    seed_match = re.search(seed_pattern, match_text)
-    if seed_match and seed_match.group(2):
-        winner_seed = f"#{seed_match.group(2)}"
-        winner_seed_num = int(seed_match.group(2))
+    # Pull all six captures in one C call instead of one .group() per field.
+    # Name/school groups capture non-space boundaries, so no strip is
+    # needed; keep one defensive strip on the looser win-type group.
+    # Intern the win-type text - only ~10 distinct values recur across the
+    # whole tournament, so every MatchResult shares one str per variant
+    # (bracket/full_round/win_type already reference shared constants)
+    winner_name, winner_school, seed, win_type_full, loser_name, loser_school = \
+        match.group('wname', 'wschool', 'seed', 'wt', 'lname', 'lschool')
+    win_type_full = sys.intern(win_type_full.strip())
+    winner_seed = f"#{seed}" if seed else None
+    winner_seed_num = int(seed) if seed else None
     
     # Parse win type and bonus points
     win_type, bonus_points = _parse_win_type(win_type_full, match_text)
     
     # Handle placement matches specifically
     if is_placement_match:
-        # Extract the placement number (e.g., "3rd Place Match" -> 3)
-        placement_num = None
-        for place in ["1st", "2nd", "3rd", "4th", "5th", "6th", "7th", "8th"]:
-            if place in match_text:
-                placement_num = int(place[0])
-                break
-        
+        # Extract the placement number and its suffix in one scan
+        # (e.g., "3rd Place Match" -> 3, "rd")
+        place_match = _PLACE_NUM_RE.search(match_text)
+        placement_num = int(place_match.group(1)) if place_match else None
+        place_suffix = place_match.group(2) if place_match else 'th'
+
+
         # Determine winner and loser placements
-        winner_placement = None
-        loser_placement = None
-        
-        if placement_num == 1:  # Finals
-            winner_placement = 1
-            loser_placement = 2
-        elif placement_num == 3:  # 3rd place match
-            winner_placement = 3
-            loser_placement = 4
-        elif placement_num == 5:  # 5th place match
-            winner_placement = 5
-            loser_placement = 6
-        elif placement_num == 7:  # 7th place match
-            winner_placement = 7
-            loser_placement = 8
-        
-        return {
-            'is_placement_match': True,
-            'placement_match': f"{placement_num}{'st' if placement_num == 1 else 'rd' if placement_num == 3 else 'th'} Place",
-            'winner_name': winner_name,
-            'winner_school': winner_school,
-            'winner_placement': winner_placement,
-            'winner_seed': winner_seed,
-            'winner_seed_num': winner_seed_num,
-            'loser_name': loser_name,
-            'loser_school': loser_school,
-            'loser_placement': loser_placement,
-            'weight': current_weight,
-            'win_type': win_type,
-            'win_type_full': win_type_full,
-            'advancement_points': 0.0,  # No advancement points for placement matches
-            'bonus_points': bonus_points,
-            'total_points': bonus_points,  # Only bonus points in placement matches
-            'match_text': match_text
-        }
+        winner_placement, loser_placement = _PLACEMENT_PAIRS.get(placement_num, (None, None))
+
+
+        return MatchResult(
+            is_placement_match=True,
+            placement_match=sys.intern(f"{placement_num}{place_suffix} Place"),
+            winner_name=winner_name,
+            winner_school=winner_school,
+            winner_placement=winner_placement,
+            winner_seed=winner_seed,
+            winner_seed_num=winner_seed_num,
+            loser_name=loser_name,
+            loser_school=loser_school,
+            loser_placement=loser_placement,
+            weight=current_weight,
+            win_type=win_type,
+            win_type_full=win_type_full,
+            advancement_points=0.0,  # No advancement points for placement matches
+            bonus_points=bonus_points,
+            total_points=bonus_points,  # Only bonus points in placement matches
+            match_text=match_text
+        )
     
     # For non-placement matches
     if round_info:
-        bracket = round_info["bracket"]
-        round_num = round_info["round_num"]
-        full_round = round_info["full_round"]
-        advancement_points = round_info["advancement_points"]
+        bracket = round_info.bracket
+        round_num = round_info.round_num
+        full_round = round_info.full_round
+        advancement_points = round_info.advancement_points
     else:
         # Default to championship bracket if we couldn't determine the round
         log_debug(f"Could not determine round for: {match_text}, defaulting to championship bracket")
@@ -209,15 +357,19 @@ def _parse_match_with_pattern(match_text: str, current_weight: Optional[str],
         full_round = "Unknown"
         advancement_points = 1.0
     
-    # Double check for specifically problematic formats
-    if "(SV-1" in match_text or " SV-1 " in match_text:
-        win_type = "SV"
-        win_type_full = "sudden victory"
-        log_problem(f"SV-1 pattern detected: {match_text}")
-    elif "(TB-1" in match_text or " TB-1 " in match_text:
-        win_type = "TB"
-        win_type_full = "tie breaker"
-        log_problem(f"TB-1 pattern detected: {match_text}")
+    # Double check for specifically problematic formats - one scan for
+    # either tag instead of four substring passes
+    tag_match = _SVTB_RE.search(match_text)
+    if tag_match:
+        tag = tag_match.group(1) or tag_match.group(2)
+        if tag == "SV":
+            win_type = "SV"
+            win_type_full = "sudden victory"
+            log_problem(f"SV-1 pattern detected: {match_text}")
+        else:
+            win_type = "TB"
+            win_type_full = "tie breaker"
+            log_problem(f"TB-1 pattern detected: {match_text}")
     
     # Calculate total points (advancement + bonus)
     total_points = advancement_points + bonus_points
@@ -226,25 +378,25 @@ def _parse_match_with_pattern(match_text: str, current_weight: Optional[str],
         log_problem(f"Detected {win_type} match: {match_text}")
     
     # Return the parsed match info
-    return {
-        'is_placement_match': False,
-        'bracket': bracket,
-        'round_num': round_num,
-        'full_round': full_round,
-        'winner_name': winner_name,
-        'winner_school': winner_school,
-        'winner_seed': winner_seed,
-        'winner_seed_num': winner_seed_num,
-        'weight': current_weight,
-        'loser_name': loser_name,
-        'loser_school': loser_school,
-        'win_type': win_type,
-        'win_type_full': win_type_full,
-        'advancement_points': advancement_points,
-        'bonus_points': bonus_points,
-        'total_points': total_points,
-        'match_text': match_text
-    }
+    return MatchResult(
+        is_placement_match=False,
+        bracket=bracket,
+        round_num=round_num,
+        full_round=full_round,
+        winner_name=winner_name,
+        winner_school=winner_school,
+        winner_seed=winner_seed,
+        winner_seed_num=winner_seed_num,
+        weight=current_weight,
+        loser_name=loser_name,
+        loser_school=loser_school,
+        win_type=win_type,
+        win_type_full=win_type_full,
+        advancement_points=advancement_points,
+        bonus_points=bonus_points,
+        total_points=total_points,
+        match_text=match_text
+    )
 
 
 def _parse_win_type(win_type_full: str, match_text: str) -> Tuple[str, float]:
@@ -258,41 +410,18 @@ def _parse_win_type(win_type_full: str, match_text: str) -> Tuple[str, float]:
     Returns:
         Tuple of (win_type, bonus_points)
     """
-    # Handle different win types - robust detection
-    if "tech fall" in win_type_full:
-        bonus_points = 1.5
-        win_type = "TF"
-    elif "major decision" in win_type_full:
-        bonus_points = 1.0
-        win_type = "MD"
-    elif any(x in win_type_full for x in ["fall", "pin"]) and "tech fall" not in win_type_full:
-        bonus_points = 2.0
-        win_type = "Fall"
-    elif any(x in win_type_full for x in ["default", "forfeit", "disqualification", "misconduct"]):
-        bonus_points = 2.0
-        win_type = "Def/DQ"
-    elif "sudden victory" in win_type_full or win_type_full.startswith("sudden victory"):
-        bonus_points = 0.0
-        win_type = "SV"
-    elif "tie breaker" in win_type_full or win_type_full.startswith("tie breaker"):
-        bonus_points = 0.0
-        win_type = "TB"
-    elif "decision" in win_type_full:
-        bonus_points = 0.0
-        win_type = "Dec"
-    else:
-        # Check the entire match text for patterns
-        if "sudden victory" in match_text or " SV-1 " in match_text or " SV-2 " in match_text or "(SV-1" in match_text:
-            bonus_points = 0.0
-            win_type = "SV"
-        elif "tie breaker" in match_text or " TB-1 " in match_text or " TB-2 " in match_text or "(TB-1" in match_text:
-            bonus_points = 0.0
-            win_type = "TB"
-        else:
-            bonus_points = 0.0
-            win_type = "Other"
-    
-    return win_type, bonus_points
+    # Handle different win types - one case-insensitive alternation scan plus
+    # dict dispatch; only the matched token gets lowercased for the lookup
+    win_match = _WIN_RE.search(win_type_full)
+    if win_match:
+        return _WIN_MAP[win_match.group(0).lower()]
+
+    # Check the entire match text for patterns
+    if _SV_FALLBACK_RE.search(match_text):
+        return "SV", 0.0
+    if _TB_FALLBACK_RE.search(match_text):
+        return "TB", 0.0
+    return "Other", 0.0
 
 
 def analyze_win_types(results_text: str) -> None:
@@ -302,21 +431,13 @@ def analyze_win_types(results_text: str) -> None:
     Args:
         results_text: Full text of results
     """
-    win_types = set()
-    for line in results_text.split('\n'):
-        if "won by" in line or "won in" in line:
-            # Extract the win type portion
-            win_start = line.find("won by ") 
-            if win_start == -1:
-                win_start = line.find("won in ")
-            
-            if win_start != -1:
-                win_start += 7  # Length of "won by " or "won in "
-                win_end = line.find(" over", win_start)
-                if win_end != -1:
-                    win_type = line[win_start:win_end].strip()
-                    win_types.add(win_type)
-    
+    # One finditer pass over the whole buffer - no per-line list is ever
+    # materialized (the pattern cannot cross a newline, so hits stay per-line)
+    win_types = {
+        m.group(1).strip()
+        for m in _WINTYPE_EXTRACT_RE.finditer(results_text)
+    }
+
     # Log all win types found
     log_problem("ALL WIN TYPES FOUND:")
     for win_type in sorted(win_types):
@@ -333,44 +454,11 @@ def find_specific_wrestlers(results_text: str, specific_names: list) -> None:
     """
     log_problem("\nSPECIFIC WRESTLER SEARCH:")
     for name in specific_names:
-        occurrences = []
-        for line in results_text.split('\n'):
-            if name in line:
-                occurrences.append(line)
-        
+        # Scan the full buffer for lines containing the name - only matching
+        # lines are ever pulled out as strings, the rest stay in the buffer
+        line_re = re.compile(rf"^.*{re.escape(name)}.*$", re.MULTILINE)
+        occurrences = [m.group(0) for m in line_re.finditer(results_text)]
+
         log_problem(f"Wrestler '{name}' found in {len(occurrences)} lines:")
         for line in occurrences:
-            log_problem(f"  {line}")
-
-
-def parse_placement_line(line: str, current_weight: Optional[str] = None) -> Optional[Dict[str, Any]]:
-    """
-    Parse lines that explicitly state a wrestler's placement
-    
-    Example format: "1st: John Smith (Iowa State)"
-    
-    Args:
-        line: Line of text to parse
-        current_weight: Current weight class being processed
-        
-    Returns:
-        Dictionary with placement information or None if parsing fails
-    """
-    placement_pattern = r"(\d+)(?:st|nd|rd|th):\s+(.*?)\s+\((.*?)\)"
-    match = re.search(placement_pattern, line)
-    
-    if match:
-        placement = int(match.group(1))
-        wrestler_name = match.group(2).strip()
-        wrestler_school = match.group(3).strip()
-        
-        log_debug(f"Found placement: {placement} - {wrestler_name} ({wrestler_school})")
-        
-        return {
-            'placement': placement,
-            'wrestler_name': wrestler_name,
-            'wrestler_school': wrestler_school,
-            'weight': current_weight
-        }
-    
-    return None
\ No newline at end of file
+            log_problem(f"  {line}")
\ No newline at end of file
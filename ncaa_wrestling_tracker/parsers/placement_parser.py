@@ -5,6 +5,9 @@ import re
 from typing import Optional, Dict, Any
 from ncaa_wrestling_tracker.utils.logging_utils import log_debug
 
+# Compiled once at import - shared by every placement lookup
+_PLACEMENT_RE = re.compile(r"(\d+)(?:st|nd|rd|th):\s+(.*?)\s+\((.*?)\)")
+
 
 def parse_placement_line(line: str, current_weight: Optional[str] = None) -> Optional[Dict[str, Any]]:
     """
@@ -19,9 +22,12 @@ def parse_placement_line(line: str, current_weight: Optional[str] = None) -> Opt
     Returns:
         Dictionary with placement information or None if parsing fails
     """
-    placement_pattern = r"(\d+)(?:st|nd|rd|th):\s+(.*?)\s+\((.*?)\)"
-    match = re.search(placement_pattern, line)
-    
+    # Placement lines always contain a colon - skip the regex when absent
+    if ":" not in line:
+        return None
+
+    match = _PLACEMENT_RE.search(line)
+
     if match:
         placement = int(match.group(1))
         wrestler_name = match.group(2).strip()
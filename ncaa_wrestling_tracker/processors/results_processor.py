@@ -4,19 +4,115 @@ Process wrestling tournament results
 import re
 import pandas as pd
 from collections import defaultdict
-from typing import Dict, List, Any, Tuple
+from dataclasses import dataclass, field, fields
+from typing import Dict, List, Any, Optional, Tuple
 from ncaa_wrestling_tracker import config
 from ncaa_wrestling_tracker.utils.logging_utils import log_debug, log_problem
-from ncaa_wrestling_tracker.parsers.match_parser import parse_match_result, analyze_win_types, find_specific_wrestlers
+from ncaa_wrestling_tracker.parsers.match_parser import ParserState, parse_match_result, analyze_win_types, find_specific_wrestlers
 from ncaa_wrestling_tracker.parsers.match_parser import ROUND_MAPPING  # Import the round mapping dictionary
 from ncaa_wrestling_tracker.parsers.placement_parser import parse_placement_line
 from ncaa_wrestling_tracker.processors.wrestler_matcher import get_wrestler_data
 from ncaa_wrestling_tracker.processors.scorer import assign_placement_points
 
 
-def parse_wrestling_results(results_text: str, drafted_wrestlers: Dict[str, List[Dict[str, Any]]], 
-                           wrestler_lookup: Dict, weight_seed_lookup: Dict, 
-                           all_wrestlers: List, problem_wrestler_info: Dict) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+# Hot-loop patterns compiled once at import instead of per line, and the
+# problem-wrestler watch list paired with its lowercase form so the per-line
+# check never re-lowers each name
+# Weight-class lines are exact tokens, so a frozenset membership test
+# replaces the anchored regex ('DH' covers the double-header column)
+WEIGHT_CLASSES = frozenset(config.WEIGHT_CLASSES) | {'DH'}
+# All round names in one alternation so header detection is a single scan
+# instead of one substring test per ROUND_MAPPING key
+ROUND_NAMES = tuple(ROUND_MAPPING)
+ROUND_HEADER_RE = re.compile('|'.join(map(re.escape, ROUND_NAMES)))
+SV_PATTERN = re.compile(r"Round \d+ - (.*?) \((.*?)\).*?over (.*?) \((.*?)\)")
+# Canonical display rank for round columns in the round-by-round summary
+ROUND_CATEGORY_ORDER = {name: i for i, name in enumerate([
+    'Prelim', 'Pig Tails',
+    'Champ. R1', 'Champ. R2', 'Quarters', 'Semis', 'Finals',
+    'Cons. Pig Tails', 'Cons. R1', 'Cons. R2', 'Cons. R3', 'Cons. R4', 'Cons. R5', 'Cons. Semis',
+    '3rd Place', '5th Place', '7th Place'
+])}
+_PROBLEM_WRESTLERS_LOWER = [(w, w.lower()) for w in config.PROBLEM_WRESTLERS]
+# All watch-list names in one case-insensitive alternation (longest first so
+# overlapping names resolve to the longer match) - a single C-level scan per
+# line replaces one substring search per name
+_PROBLEM_SCAN_RE = re.compile(
+    "|".join(re.escape(w) for w in sorted(config.PROBLEM_WRESTLERS, key=len, reverse=True)),
+    re.IGNORECASE
+)
+
+
+@dataclass(slots=True)
+class WrestlerResult:
+    """Per-wrestler scoring accumulator. Slotted attributes replace the old
+    13-key dict template - no per-instance hash table, and each field access
+    is a direct slot load. Dict-style access is kept so the scorer keeps
+    working unchanged."""
+    owner: Optional[str] = None
+    weight: Optional[str] = None
+    seed: Optional[str] = None
+    champ_wins: int = 0
+    champ_advancement: float = 0
+    champ_bonus: float = 0
+    cons_wins: int = 0
+    cons_advancement: float = 0
+    cons_bonus: float = 0
+    placement: Optional[int] = None
+    placement_points: float = 0
+    total_points: float = 0
+    match_count: int = 0
+    matches: List[Dict[str, Any]] = field(default_factory=list)
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        setattr(self, key, value)
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+
+def _record_win(result: WrestlerResult, match_detail: Dict[str, Any], *,
+                is_placement: bool, bracket: Optional[str],
+                bonus_points: float, total_points: float) -> None:
+    """Apply one winning match to a wrestler's accumulator"""
+    # The match history is not a debug artifact: assign_placement_points
+    # rebuilds advancement/bonus totals from it, and the report generator,
+    # analytics and app all render per-match rows, so it must always be kept
+    result.matches.append(match_detail)
+    result.match_count += 1
+
+    # Advancement points are not maintained here: assign_placement_points
+    # recomputes champ/cons advancement from the match history for every
+    # wrestler before the DataFrame is built, so per-match updates of those
+    # derived fields were pure overhead
+    if is_placement:
+        # Only count bonus points for placement matches
+        result.total_points += bonus_points
+    elif bracket == "Champ":
+        result.champ_wins += 1
+        result.champ_bonus += bonus_points
+        result.total_points += total_points
+    else:
+        result.cons_wins += 1
+        result.cons_bonus += bonus_points
+        result.total_points += total_points
+
+
+def _placement_points(placement: int) -> int:
+    """Points for a placement via one array gather (0 for out-of-range)"""
+    return int(config.PLACEMENT_POINTS_ARR[placement]) if 0 < placement < 9 else 0
+
+
+def parse_wrestling_results(results_text: str, drafted_wrestlers: Dict[str, List[Dict[str, Any]]],
+                           wrestler_lookup: Dict, weight_seed_lookup: Dict,
+                           all_wrestlers: pd.DataFrame, problem_index,
+                           override_index: Dict) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     """
     Parse wrestling tournament results and calculate points for drafted wrestlers.
     
@@ -25,8 +121,10 @@ def parse_wrestling_results(results_text: str, drafted_wrestlers: Dict[str, List
         drafted_wrestlers: Dictionary mapping participant names to lists of wrestlers they drafted
         wrestler_lookup: Dictionary for looking up wrestlers by (name, school)
         weight_seed_lookup: Dictionary for looking up wrestlers by (weight, seed)
-        all_wrestlers: List of all drafted wrestlers
-        problem_wrestler_info: Dictionary of problematic wrestlers
+        all_wrestlers: DataFrame of all drafted wrestlers
+        problem_index: Pre-standardized problem-wrestler index from
+            build_wrestler_lookup
+        override_index: Dictionary of wrestlers by original (name, school)
         
     Returns:
         Tuple of (results_df, round_df, placements_df) DataFrames
@@ -38,40 +136,31 @@ def parse_wrestling_results(results_text: str, drafted_wrestlers: Dict[str, List
         # Look for specific problem wrestlers
         find_specific_wrestlers(results_text, ["Caleb Smith", "Garrett Thompson", "Ben Kueter"])
         
-        # Create dictionaries to store wrestler results
-        wrestler_results = defaultdict(lambda: {
-            'owner': None,
-            'weight': None,
-            'seed': None,
-            'champ_wins': 0,
-            'champ_advancement': 0,
-            'champ_bonus': 0,
-            'cons_wins': 0,
-            'cons_advancement': 0,
-            'cons_bonus': 0,
-            'placement': None,
-            'placement_points': 0,
-            'total_points': 0,
-            'match_count': 0,
-            'matches': []
-        })
+        # Create dictionaries to store wrestler results. A plain dict: every
+        # insertion goes through the winner branch below, which seeds the
+        # entry with owner/weight/seed (a bare default factory could not)
+        wrestler_results = {}
         
         # Create dictionary to track wrestler placements
         wrestler_placements = {}
         
-        # Create a dictionary to track round-by-round results
-        round_results = {}
-        
-        # Initialize round results for all wrestlers
-        for wrestler in all_wrestlers:
-            wrestler_id = f"{wrestler['name']} ({wrestler['school']})"
-            round_results[wrestler_id] = {
-                'Owner': wrestler['team'],
-                'Weight': wrestler['weight'],
-                'Wrestler': wrestler['name'],
-                'School': wrestler['school'],
-                'Seed': wrestler['seed']
-                # Rounds will be added as we process results
+        # Track round-by-round results column-major: static wrestler metadata
+        # in one dict, and one {wrestler_id: result} dict per round so the
+        # final DataFrame is assembled column by column with no key-union
+        # inference over heterogeneous row dicts
+        round_meta = {}
+        round_col_data = defaultdict(dict)
+        
+        # Initialize round metadata for all wrestlers (itertuples over the
+        # columnar roster frame; no per-row dict to unpack)
+        for wrestler in all_wrestlers.itertuples(index=False):
+            wrestler_id = f"{wrestler.name} ({wrestler.school})"
+            round_meta[wrestler_id] = {
+                'Owner': wrestler.team,
+                'Weight': wrestler.weight,
+                'Wrestler': wrestler.name,
+                'School': wrestler.school,
+                'Seed': wrestler.seed
             }
         
         # Track matches for debugging
@@ -89,34 +178,35 @@ def parse_wrestling_results(results_text: str, drafted_wrestlers: Dict[str, List
         # Track all rounds encountered
         all_rounds = set()
         
-        # Track matches by wrestler name (for troubleshooting specific wrestlers)
-        matches_by_wrestler = defaultdict(list)
+        # Track matches by wrestler name (for troubleshooting specific
+        # wrestlers) - preallocated so hits append without a factory call
+        # and the log pass iterates in configured order
+        matches_by_wrestler = {w: [] for w in config.PROBLEM_WRESTLERS}
         
-        # First pass - identify all problematic matches and explicit placements
+        # Single pass - placement collection, problem-wrestler tracking and
+        # the actual parsing all happen in one traversal of the text
         current_section = None
         current_weight = None
-        for line in results_text.split('\n'):
+        parser_state = ParserState()
+        # splitlines also copes with \r\n input without a prior replace
+        lines = results_text.splitlines()
+        for line in lines:
             line = line.strip()
             if not line:
                 continue
                 
-            # Check if this is a section header (no hyphen and not a weight class)
-            if '-' not in line and not re.match(r'^(125|133|141|149|157|165|174|184|197|285|DH)$', line):
-                # Store as a potential section header
-                potential_section = line
-                # Check if it's a known round type
-                for round_name in ROUND_MAPPING.keys():
-                    if round_name in potential_section:
-                        current_section = potential_section
-                        log_debug(f"Found section header: {current_section}")
-                        break
-                continue
-                
-            # Check if this is a weight class indicator
-            if re.match(r'^(125|133|141|149|157|165|174|184|197|285|DH)$', line):
-                current_weight = line
+            # Weight indicators and section headers are both hyphen-free, so
+            # match lines (which always carry the separator) skip both tests
+            # after the single containment check
+            if '-' not in line:
+                if line in WEIGHT_CLASSES:
+                    current_weight = line
+                elif ROUND_HEADER_RE.search(line):
+                    # Treat it as a section header naming a known round type
+                    current_section = line
+                    log_debug("Processing section: %s", current_section)
                 continue
-                
+
             # Check for explicit placement lines (e.g., "1st: John Smith (Iowa State)")
             placement_info = parse_placement_line(line, current_weight)
             if placement_info:
@@ -124,10 +214,10 @@ def parse_wrestling_results(results_text: str, drafted_wrestlers: Dict[str, List
                 wrestler_school = placement_info['wrestler_school']
                 placement = placement_info['placement']
                 weight = placement_info['weight']
-                
+
                 # Create a unique key for this wrestler
                 wrestler_key = f"{wrestler_name} ({wrestler_school})"
-                
+
                 # Store the placement information
                 if wrestler_key not in wrestler_placements:
                     wrestler_placements[wrestler_key] = {
@@ -135,59 +225,36 @@ def parse_wrestling_results(results_text: str, drafted_wrestlers: Dict[str, List
                         'school': wrestler_school,
                         'weight': weight,
                         'placement': placement,
-                        'points': config.PLACEMENT_POINTS.get(placement, 0)
+                        'points': _placement_points(placement)
                     }
-                    log_debug(f"Recorded placement {placement} for {wrestler_key}")
+                    log_debug("Recorded placement %s for %s", placement, wrestler_key)
                 continue
-                
-            # Check for problematic wrestlers
-            for wrestler in config.PROBLEM_WRESTLERS:
-                if wrestler.lower() in line.lower():
-                    # Pre-check if this looks like a sudden victory or tie breaker match
-                    if "sudden victory" in line or "SV-1" in line or "tie breaker" in line or "TB-1" in line:
-                        log_problem(f"Found potential special match format for {wrestler}: {line}")
-                        
-                    # Store this match text under this wrestler's name
-                    matches_by_wrestler[wrestler].append(line)
-        
-        # Second pass - do the actual parsing
-        current_section = None
-        current_weight = None
-        for line in results_text.split('\n'):
-            line = line.strip()
-            if not line:
-                continue
-                
-            # Check if this is a section header
-            if '-' not in line and not re.match(r'^(125|133|141|149|157|165|174|184|197|285|DH)$', line):
-                # Store as a potential section header
-                potential_section = line
-                # Check if it's a known round type
-                for round_name in ROUND_MAPPING.keys():
-                    if round_name in potential_section:
-                        current_section = potential_section
-                        log_debug(f"Processing section: {current_section}")
-                        break
-                continue
-                
-            # Check if this is a weight class indicator
-            if re.match(r'^(125|133|141|149|157|165|174|184|197|285|DH)$', line):
-                current_weight = line
-                continue
-            
+
+            # Check for problematic wrestlers - one combined scan of the line,
+            # then walk the watch list in its configured order for the hits
+            problem_hits = {m.group(0).lower() for m in _PROBLEM_SCAN_RE.finditer(line)}
+            if problem_hits:
+                for wrestler, wrestler_lower in _PROBLEM_WRESTLERS_LOWER:
+                    if wrestler_lower in problem_hits:
+                        # Pre-check if this looks like a sudden victory or tie breaker match
+                        if "sudden victory" in line or "SV-1" in line or "tie breaker" in line or "TB-1" in line:
+                            log_problem(f"Found potential special match format for {wrestler}: {line}")
+
+                        # Store this match text under this wrestler's name
+                        matches_by_wrestler[wrestler].append(line)
+
             # Parse match result - with more robust handling and passing section header
-            match_info = parse_match_result(line, current_weight, current_section)
+            match_info = parse_match_result(line, current_weight, current_section, parser_state)
             if not match_info:
-                log_debug(f"Failed to parse line: {line}")
+                log_debug("Failed to parse line: %s", line)
                 # Add special handling if this looks like a problematic case
-                if any(wrestler.lower() in line.lower() for wrestler in config.PROBLEM_WRESTLERS):
+                if problem_hits:
                     log_problem(f"Failed to parse problematic match: {line}")
                     # Try harder to extract match information
                     # This is a simplified extraction for sudden victory and tie breaker matches
                     if "sudden victory" in line or "SV-1" in line:
                         # Extract winner and loser using a very permissive pattern
-                        simple_pattern = r"Round \d+ - (.*?) \((.*?)\).*?over (.*?) \((.*?)\)"
-                        simple_match = re.search(simple_pattern, line)
+                        simple_match = SV_PATTERN.search(line)
                         if simple_match:
                             log_problem(f"Extracted basic match info from SV match: {line}")
                             # Process this match with basic info
@@ -195,42 +262,57 @@ def parse_wrestling_results(results_text: str, drafted_wrestlers: Dict[str, List
                 continue
                 
             matches_processed += 1
-            
+
+            # Bind the hot match_info fields to locals once - the winner and
+            # loser blocks below read each of them several times per match
+            win_type = match_info['win_type']
+            win_type_full = match_info['win_type_full']
+            bonus_points = match_info['bonus_points']
+            total_points = match_info['total_points']
+            is_placement = match_info.get('is_placement_match', False)
+            bracket = match_info.get('bracket')
+            full_round = match_info.get('full_round')
+            round_key = full_round if full_round is not None else 'Placement'
+            winner_name = match_info['winner_name']
+            winner_school = match_info['winner_school']
+            loser_name = match_info['loser_name']
+            loser_school = match_info['loser_school']
+
             # Handle placement matches
-            if match_info.get('is_placement_match', False):
+            if is_placement:
                 # Process winner placement
                 if match_info.get('winner_placement'):
-                    winner_key = f"{match_info['winner_name']} ({match_info['winner_school']})"
+                    winner_key = f"{winner_name} ({winner_school})"
                     wrestler_placements[winner_key] = {
-                        'name': match_info['winner_name'],
-                        'school': match_info['winner_school'],
+                        'name': winner_name,
+                        'school': winner_school,
                         'weight': match_info['weight'],
                         'placement': match_info['winner_placement'],
-                        'points': config.PLACEMENT_POINTS.get(match_info['winner_placement'], 0)
+                        'points': _placement_points(match_info['winner_placement'])
                     }
-                    log_debug(f"Recorded placement {match_info['winner_placement']} for {winner_key} from placement match")
+                    log_debug("Recorded placement %s for %s from placement match", match_info['winner_placement'], winner_key)
                 
                 # Process loser placement
                 if match_info.get('loser_placement'):
-                    loser_key = f"{match_info['loser_name']} ({match_info['loser_school']})"
+                    loser_key = f"{loser_name} ({loser_school})"
                     wrestler_placements[loser_key] = {
-                        'name': match_info['loser_name'],
-                        'school': match_info['loser_school'],
+                        'name': loser_name,
+                        'school': loser_school,
                         'weight': match_info['weight'],
                         'placement': match_info['loser_placement'],
-                        'points': config.PLACEMENT_POINTS.get(match_info['loser_placement'], 0)
+                        'points': _placement_points(match_info['loser_placement'])
                     }
-                    log_debug(f"Recorded placement {match_info['loser_placement']} for {loser_key} from placement match")
+                    log_debug("Recorded placement %s for %s from placement match", match_info['loser_placement'], loser_key)
             
             # Add this round to the set of all rounds
-            if 'full_round' in match_info:
-                all_rounds.add(match_info['full_round'])
-            
+            if full_round is not None:
+                all_rounds.add(full_round)
+
             # Track sudden victory and tie breaker matches
-            if match_info['win_type'] == 'SV':
+            if win_type == 'SV':
                 sv_matches.append(line)
                 log_problem(f"Confirmed sudden victory match: {line}")
-            elif match_info['win_type'] == 'TB':
+            elif win_type == 'TB':
                 tb_matches.append(line)
                 log_problem(f"Confirmed tie breaker match: {line}")
             
@@ -240,8 +322,8 @@ def parse_wrestling_results(results_text: str, drafted_wrestlers: Dict[str, List
             
             # Use the helper function to get wrestler data
             winner_data, winner_used_key, winner_match_method = get_wrestler_data(
-                match_info, 'winner', wrestler_lookup, weight_seed_lookup, 
-                problem_wrestler_info
+                match_info, 'winner', wrestler_lookup, weight_seed_lookup,
+                problem_index, override_index
             )
             
             # If we found a match, record the points and update round results
@@ -249,86 +331,63 @@ def parse_wrestling_results(results_text: str, drafted_wrestlers: Dict[str, List
                 matches_found += 1
                 wrestler_id = f"{winner_data['name']} ({winner_data['school']})"
                 
-                match_log = f"Match found for {match_info['winner_name']} ({match_info['winner_school']}) using {winner_match_method} match"
                 if winner_match_method in ["problem_list", "name_override"]:
-                    log_problem(match_log)
+                    log_problem("Match found for %s (%s) using %s match",
+                                winner_name, winner_school, winner_match_method)
                 else:
-                    log_debug(match_log)
-                
-                # Update wrestler results
-                if wrestler_id not in wrestler_results:
-                    wrestler_results[wrestler_id] = {
-                        'owner': winner_data['team'],
-                        'weight': winner_data['weight'],
-                        'seed': winner_data['seed'],
-                        'champ_wins': 0,
-                        'champ_advancement': 0,
-                        'champ_bonus': 0,
-                        'cons_wins': 0,
-                        'cons_advancement': 0,
-                        'cons_bonus': 0,
-                        'placement': None,
-                        'placement_points': 0,
-                        'total_points': 0,
-                        'match_count': 0,
-                        'matches': []
-                    }
+                    log_debug("Match found for %s (%s) using %s match",
+                              winner_name, winner_school, winner_match_method)
                 
-                result = wrestler_results[wrestler_id]
+                # Update wrestler results - one dict lookup instead of a
+                # membership test followed by a second indexing
+                result = wrestler_results.get(wrestler_id)
+                if result is None:
+                    result = wrestler_results[wrestler_id] = WrestlerResult(
+                        owner=winner_data['team'],
+                        weight=winner_data['weight'],
+                        seed=winner_data['seed']
+                    )
                 
                 # Record match details
                 match_detail = {
-                    'round': match_info['full_round'] if 'full_round' in match_info else 'Placement',
-                    'opponent': f"{match_info['loser_name']} ({match_info['loser_school']})",
-                    'result': match_info['win_type'],
-                    'win_type_full': match_info['win_type_full'],
+                    'round': round_key,
+                    'opponent': f"{loser_name} ({loser_school})",
+                    'result': win_type,
+                    'win_type_full': win_type_full,
                     'advancement_points': match_info['advancement_points'],
-                    'bonus_points': match_info['bonus_points'],
-                    'total_points': match_info['total_points'],
+                    'bonus_points': bonus_points,
+                    'total_points': total_points,
                     'match_method': winner_match_method
                 }
-                result['matches'].append(match_detail)
-                result['match_count'] += 1
-                
-                # Update points based on bracket
-                if match_info.get('is_placement_match', False):
-                    # Only count bonus points for placement matches
-                    result['total_points'] += match_info['bonus_points']
-                elif match_info.get('bracket') == "Champ":
-                    result['champ_wins'] += 1
-                    result['champ_advancement'] = result['champ_wins'] * 1.0  # Championship advancement points
-                    result['champ_bonus'] += match_info['bonus_points']
-                    result['total_points'] += match_info['total_points']
-                else:
-                    result['cons_wins'] += 1
-                    result['cons_advancement'] = result['cons_wins'] * 0.5  # Consolation advancement points
-                    result['cons_bonus'] += match_info['bonus_points']
-                    result['total_points'] += match_info['total_points']
-                    
+                _record_win(result, match_detail, is_placement=is_placement,
+                            bracket=bracket, bonus_points=bonus_points,
+                            total_points=total_points)
+
+
                 # Update round-by-round results for the winner
-                if wrestler_id in round_results:
-                    round_key = match_info['full_round'] if 'full_round' in match_info else 'Placement'
+                if wrestler_id in round_meta:
                     # Use the specific win type for special matches
-                    if match_info['win_type'] in ['SV', 'TB']:
-                        round_results[wrestler_id][round_key] = f"W-{match_info['win_type']}"
+                    if win_type in ('SV', 'TB'):
+                        round_col_data[round_key][wrestler_id] = f"W-{win_type}"
                         if winner_match_method in ["problem_list", "name_override"]:
-                            log_problem(f"Added W-{match_info['win_type']} for {wrestler_id} in {round_key}")
+                            log_problem("Added W-%s for %s in %s", win_type, wrestler_id, round_key)
                     else:
-                        round_results[wrestler_id][round_key] = f"W-{match_info['win_type']}"
+                        round_col_data[round_key][wrestler_id] = f"W-{win_type}"
             else:
                 matches_missed += 1
-                log_debug(f"NO MATCH FOUND for WINNER: {match_info['winner_name']} ({match_info['winner_school']}), " +
-                        f"Weight: {match_info.get('weight', 'Unknown')}, Seed: {match_info.get('winner_seed', 'Unknown')}")
-                
+                log_debug("NO MATCH FOUND for WINNER: %s (%s), Weight: %s, Seed: %s",
+                          winner_name, winner_school,
+                          match_info.get('weight', 'Unknown'), match_info.get('winner_seed', 'Unknown'))
+
                 # Record this mismatch for analysis
                 mismatches.append({
-                    'winner_name': match_info['winner_name'],
-                    'winner_school': match_info['winner_school'],
+                    'winner_name': winner_name,
+                    'winner_school': winner_school,
                     'weight': match_info.get('weight'),
                     'seed': match_info.get('winner_seed'),
-                    'win_type': match_info['win_type'],
-                    'win_type_full': match_info['win_type_full'],
-                    'points': match_info['total_points'],
+                    'win_type': win_type,
+                    'win_type_full': win_type_full,
+                    'points': total_points,
                     'match_text': match_info['match_text']
                 })
             
@@ -338,32 +397,32 @@ def parse_wrestling_results(results_text: str, drafted_wrestlers: Dict[str, List
             
             # Use the helper function to get wrestler data
             loser_data, loser_used_key, loser_match_method = get_wrestler_data(
-                match_info, 'loser', wrestler_lookup, weight_seed_lookup, 
-                problem_wrestler_info
+                match_info, 'loser', wrestler_lookup, weight_seed_lookup,
+                problem_index, override_index
             )
             
             # If we found a match for the loser, update round results
             if loser_data:
                 loser_id = f"{loser_data['name']} ({loser_data['school']})"
                 
-                match_log = f"Match found for LOSER: {match_info['loser_name']} ({match_info['loser_school']}) using {loser_match_method} match"
                 if loser_match_method in ["problem_list", "name_override"]:
-                    log_problem(match_log)
+                    log_problem("Match found for LOSER: %s (%s) using %s match",
+                                loser_name, loser_school, loser_match_method)
                 else:
-                    log_debug(match_log)
+                    log_debug("Match found for LOSER: %s (%s) using %s match",
+                              loser_name, loser_school, loser_match_method)
                 
                 # Update round-by-round results for the loser
-                if loser_id in round_results:
-                    round_key = match_info['full_round'] if 'full_round' in match_info else 'Placement'
+                if loser_id in round_meta:
                     # Indicate if this was a special match type
-                    if match_info['win_type'] in ['SV', 'TB']:
-                        round_results[loser_id][round_key] = f"L-{match_info['win_type']}"
+                    if win_type in ('SV', 'TB'):
+                        round_col_data[round_key][loser_id] = f"L-{win_type}"
                         if loser_match_method in ["problem_list", "name_override"]:
-                            log_problem(f"Added L-{match_info['win_type']} for {loser_id} in {round_key}")
+                            log_problem("Added L-%s for %s in %s", win_type, loser_id, round_key)
                     else:
-                        round_results[loser_id][round_key] = "L"
+                        round_col_data[round_key][loser_id] = "L"
             else:
-                log_debug(f"No match found for LOSER: {match_info['loser_name']} ({match_info['loser_school']})")
+                log_debug("No match found for LOSER: %s (%s)", loser_name, loser_school)
         
         # Log match statistics
         log_debug(f"Matches processed: {matches_processed}")
@@ -398,57 +457,55 @@ def parse_wrestling_results(results_text: str, drafted_wrestlers: Dict[str, List
             for wrestler in wrestlers:
                 wrestler_id = f"{wrestler['name']} ({wrestler['school']})"
                 if wrestler_id not in wrestler_results:
-                    log_debug(f"No matches found for {wrestler_id} on team {team}")
-        
-        # Convert results to DataFrame
-        results_df = pd.DataFrame.from_dict(wrestler_results, orient='index')
-        results_df.index.name = 'Wrestler'
-        results_df.reset_index(inplace=True)
+                    log_debug("No matches found for %s on team %s", wrestler_id, team)
         
+        # Convert results to DataFrame - from_records on the flat value dicts
+        # skips the index transpose that from_dict(orient='index') does
+        results_df = pd.DataFrame.from_records([r.as_dict() for r in wrestler_results.values()])
+        results_df.insert(0, 'Wrestler', list(wrestler_results.keys()))
+
+        # Categorical owner/weight so the sort compares integer codes
+        # instead of strings (weight's category order matches its
+        # lexicographic string order, so row order is unchanged)
+        results_df['owner'] = results_df['owner'].astype('category')
+        results_df['weight'] = results_df['weight'].astype(pd.CategoricalDtype(
+            ['125', '133', '141', '149', '157', '165', '174', '184', '197', '285', 'DH'],
+            ordered=True
+        ))
+
         # Sort by owner, then weight class
-        results_df = results_df.sort_values(['owner', 'weight'])
-        
-        # Convert round results to DataFrame
-        round_df = pd.DataFrame.from_dict(round_results, orient='index')
-        round_df.index.name = 'Wrestler ID'
-        round_df.reset_index(inplace=True)
-        
-        # Get the actual available columns that are rounds
-        available_rounds = []
-        for col in round_df.columns:
-            if col in all_rounds:
-                available_rounds.append(col)
-        
-        # Define the desired order for the rounds (only including ones that actually exist)
-        round_order = []
-        round_categories = [
-            'Prelim', 'Pig Tails', 
-            'Champ. R1', 'Champ. R2', 'Quarters', 'Semis', 'Finals',
-            'Cons. Pig Tails', 'Cons. R1', 'Cons. R2', 'Cons. R3', 'Cons. R4', 'Cons. R5', 'Cons. Semis',
-            '3rd Place', '5th Place', '7th Place'
-        ]
-        
-        # Add rounds in the desired order, but only if they exist
-        for round_name in round_categories:
-            if round_name in available_rounds:
-                round_order.append(round_name)
-        
-        # Add any remaining rounds not in our predefined list
-        for round_name in available_rounds:
-            if round_name not in round_order:
-                round_order.append(round_name)
+        results_df.sort_values(['owner', 'weight'], inplace=True)
+        
+        # Convert round results to DataFrame - metadata rows first, then one
+        # vectorized map per round column in first-seen order
+        round_df = pd.DataFrame.from_records(list(round_meta.values()))
+        round_df.insert(0, 'Wrestler ID', list(round_meta.keys()))
+        for col_name, col_values in round_col_data.items():
+            round_df[col_name] = round_df['Wrestler ID'].map(col_values)
+        
+        # Order the round columns that actually occurred: known rounds by
+        # their canonical rank, anything unexpected after them in column
+        # order (the sort is stable)
+        round_order = sorted(
+            (col for col in round_df.columns if col in all_rounds),
+            key=lambda r: ROUND_CATEGORY_ORDER.get(r, len(ROUND_CATEGORY_ORDER))
+        )
         
         # Sort the round summary by weight class and seed
         round_df['Weight'] = pd.Categorical(round_df['Weight'], 
                                         categories=['125', '133', '141', '149', '157', '165', 
                                                     '174', '184', '197', '285', 'DH'], 
                                         ordered=True)
-        round_df['Seed_Num'] = round_df['Seed'].apply(lambda x: 
-                                                    int(re.search(r'#?(\d+)', str(x)).group(1)) 
-                                                    if pd.notnull(x) and re.search(r'#?(\d+)', str(x))
-                                                    else 999)
-        round_df = round_df.sort_values(['Weight', 'Seed_Num'])
-        round_df = round_df.drop(columns=['Seed_Num'])
+        # One vectorized extract over the Seed column instead of a Python
+        # regex call per row; unseeded rows sort last as before
+        seed_num = round_df['Seed'].astype('string').str.extract(r'(\d+)', expand=False)
+        round_df['Seed_Num'] = pd.to_numeric(seed_num, errors='coerce').fillna(999).astype('int32')
+        # Sort on the categorical's integer codes with a stable mergesort -
+        # plain int comparisons instead of categorical dispatch, and no
+        # intermediate frame copies
+        round_df['_w'] = round_df['Weight'].cat.codes.astype('int8')
+        round_df.sort_values(['_w', 'Seed_Num'], kind='mergesort', inplace=True)
+        round_df.drop(columns=['_w', 'Seed_Num'], inplace=True)
         
         # Reorder the columns to have a logical flow
         cols = ['Weight', 'Wrestler', 'School', 'Seed', 'Owner']
@@ -464,9 +521,8 @@ def parse_wrestling_results(results_text: str, drafted_wrestlers: Dict[str, List
         round_df = round_df[existing_cols]
         
         # Convert placements to DataFrame
-        placements_df = pd.DataFrame.from_dict(wrestler_placements, orient='index')
-        placements_df.index.name = 'Wrestler ID'
-        placements_df.reset_index(inplace=True)
+        placements_df = pd.DataFrame.from_records(list(wrestler_placements.values()))
+        placements_df.insert(0, 'Wrestler ID', list(wrestler_placements.keys()))
         
         # Log results statistics
         log_debug(f"Total wrestlers with points: {len(results_df)}")
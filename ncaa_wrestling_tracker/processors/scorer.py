@@ -1,10 +1,45 @@
 """
 NCAA Wrestling Tournament scoring implementation
 """
+from collections import defaultdict
+
+import numpy as np
 import pandas as pd
 from ncaa_wrestling_tracker import config
 from ncaa_wrestling_tracker.utils.logging_utils import log_debug
 
+# Precomputed round-name -> scoring bucket table so classification is one
+# dict probe per distinct round instead of repeated startswith/contains
+# checks. 'Pig Tails' deliberately maps to 'other': the old branch chain
+# never credited it to any bucket
+# Tokens identifying the wrestler whose scoring gets special handling and a
+# verification dump below; matched once against a pre-lowered id
+_CALEB_MARKER = ('caleb smith', 'nebraska')
+
+ROUND_KIND = {
+    'Prelim': 'champ', 'Champ. R1': 'champ', 'Champ. R2': 'champ',
+    'Quarters': 'champ', 'Semis': 'champ', 'Finals': 'champ',
+    'Cons. Pig Tails': 'cons', 'Cons. R1': 'cons', 'Cons. R2': 'cons',
+    'Cons. R3': 'cons', 'Cons. R4': 'cons', 'Cons. R5': 'cons',
+    'Cons. Semis': 'cons',
+    'Placement': 'placement', '3rd Place': 'placement',
+    '5th Place': 'placement', '7th Place': 'placement',
+    'Pig Tails': 'other',
+}
+
+
+def _classify_round(round_name: str) -> str:
+    """Fallback classifier for round names missing from ROUND_KIND, with the
+    same precedence as the original branch chain"""
+    if ('3rd Place' in round_name or '5th Place' in round_name
+            or '7th Place' in round_name):
+        return 'placement'
+    if round_name.startswith('Champ') or round_name in ('Prelim', 'Quarters', 'Semis', 'Finals'):
+        return 'champ'
+    if round_name.startswith('Cons'):
+        return 'cons'
+    return 'other'
+
 def calculate_team_points(results_df: pd.DataFrame) -> pd.DataFrame:
     """
     Calculate total points per team/owner with correct NCAA scoring breakdown.
@@ -25,28 +60,80 @@ def calculate_team_points(results_df: pd.DataFrame) -> pd.DataFrame:
     if 'placement_points' not in results_df.columns:
         results_df['placement_points'] = 0.0
         
-    team_summary = results_df.groupby('owner').agg({
-        'champ_wins': 'sum',  # Count of championship wins
-        'champ_advancement': 'sum',  # Championship advancement points
-        'champ_bonus': 'sum',  # Championship bonus points
-        'cons_wins': 'sum',  # Count of consolation wins
-        'cons_advancement': 'sum',  # Consolation advancement points
-        'cons_bonus': 'sum',  # Consolation bonus points
-        'placement_points': 'sum',  # Placement points
-        'total_points': 'sum',  # Total points
-        'Wrestler': 'count'  # Count of wrestlers with points
-    }).reset_index()
-    
+    # One numeric sum over all point columns instead of a mixed agg dict,
+    # which dispatches a separate kernel per column. The wrestler count is a
+    # plain group size (every row has a Wrestler). sort=False skips sorting
+    # group keys we re-sort by total_points anyway
+    point_columns = ['champ_wins', 'champ_advancement', 'champ_bonus',
+                     'cons_wins', 'cons_advancement', 'cons_bonus',
+                     'placement_points', 'total_points']
+    # owner arrives as a categorical from parse_wrestling_results, so the
+    # groupby runs on integer codes; observed=True keeps only real teams
+    grouped = results_df.groupby('owner', sort=False, observed=True)
+    team_summary = grouped[point_columns].sum()
+    team_summary['Wrestlers with Points'] = grouped.size()
+    team_summary = team_summary.reset_index()
+
     # Add columns for total advancement and total bonus
     team_summary['total_advancement'] = team_summary['champ_advancement'] + team_summary['cons_advancement']
     team_summary['total_bonus'] = team_summary['champ_bonus'] + team_summary['cons_bonus']
-    
-    team_summary = team_summary.rename(columns={'Wrestler': 'Wrestlers with Points'})
+
     team_summary = team_summary.sort_values('total_points', ascending=False)
     
     return team_summary
 
 
+def _match_points_by_wrestler(wrestler_results: dict) -> dict:
+    """Sum advancement/bonus points per wrestler from the match history.
+
+    Flattens every match into one long DataFrame and classifies rounds with
+    vectorized string ops, so the per-match Python loop collapses into a
+    handful of columnar operations. Returns a dict mapping wrestler_id to a
+    dict with champ_adv, champ_bonus, cons_adv, cons_bonus and
+    placement_bonus totals; wrestlers without matches are absent.
+    """
+    records = [
+        (wrestler_id, match['round'], match['advancement_points'], match['bonus_points'])
+        for wrestler_id, result in wrestler_results.items()
+        for match in result.get('matches', [])
+    ]
+    if not records:
+        return {}
+
+    df = pd.DataFrame.from_records(records, columns=['wid', 'round', 'adv', 'bonus'])
+
+    # Classify every round with one dict probe via the precomputed table;
+    # only names the table has never seen fall back to the string checks
+    kind = df['round'].map(ROUND_KIND)
+    if kind.isna().any():
+        unknown = kind.isna()
+        kind[unknown] = df.loc[unknown, 'round'].map(_classify_round)
+    is_placement = (kind == 'placement').to_numpy()
+    is_champ = (kind == 'champ').to_numpy()
+    is_cons = (kind == 'cons').to_numpy()
+
+    # Reduce with bincount over integer wrestler codes - a compiled
+    # scatter-add over flat arrays, cheaper than a five-column groupby
+    codes, wrestler_ids = pd.factorize(df['wid'])
+    n = len(wrestler_ids)
+    adv = df['adv'].to_numpy(dtype=np.float64)
+    bonus = df['bonus'].to_numpy(dtype=np.float64)
+    champ_adv = np.bincount(codes, weights=adv * is_champ, minlength=n)
+    champ_bonus = np.bincount(codes, weights=bonus * is_champ, minlength=n)
+    cons_adv = np.bincount(codes, weights=adv * is_cons, minlength=n)
+    cons_bonus = np.bincount(codes, weights=bonus * is_cons, minlength=n)
+    placement_bonus = np.bincount(codes, weights=bonus * is_placement, minlength=n)
+
+    return {
+        wrestler_id: {
+            'champ_adv': champ_adv[i], 'champ_bonus': champ_bonus[i],
+            'cons_adv': cons_adv[i], 'cons_bonus': cons_bonus[i],
+            'placement_bonus': placement_bonus[i],
+        }
+        for i, wrestler_id in enumerate(wrestler_ids)
+    }
+
+
 def assign_placement_points(wrestler_results: dict, wrestler_placements: dict) -> None:
     """
     Process and assign placement points to wrestlers
@@ -56,7 +143,19 @@ def assign_placement_points(wrestler_results: dict, wrestler_placements: dict) -
         wrestler_placements: Dictionary of wrestler placements
     """
     log_debug(f"\nAssigning placement points to wrestlers:")
-    
+
+    # Inverted index for the fuzzy fallback below: word token -> result ids
+    # containing it, plus each id's insertion position so the first match in
+    # dict order still wins. Candidate pruning only - the original substring
+    # test stays as the ground truth, so ids whose school is a substring of
+    # another (e.g. Iowa / Iowa State) behave exactly as before
+    token_index = defaultdict(list)
+    id_order = {}
+    for position, result_id in enumerate(wrestler_results):
+        id_order[result_id] = position
+        for token in result_id.replace('(', ' ').replace(')', ' ').split():
+            token_index[token].append(result_id)
+
     # First pass: Assign placements from wrestler_placements to wrestler_results
     for wrestler_id, placement_data in wrestler_placements.items():
         if wrestler_id in wrestler_results:
@@ -69,10 +168,17 @@ def assign_placement_points(wrestler_results: dict, wrestler_placements: dict) -
             
             log_debug(f"  {wrestler_id}: {placement}th place, {points} points")
         else:
-            # Try to match this wrestler to someone in our results
+            # Try to match this wrestler to someone in our results. The
+            # token index narrows the scan from every result id to the
+            # handful sharing a name or school word
             matched = False
-            for result_id in wrestler_results.keys():
-                if (placement_data['name'] in result_id or 
+            candidates = set()
+            for token in placement_data['name'].split():
+                candidates.update(token_index.get(token, ()))
+            for token in placement_data['school'].split():
+                candidates.update(token_index.get(token, ()))
+            for result_id in sorted(candidates, key=id_order.get):
+                if (placement_data['name'] in result_id or
                     placement_data['school'] in result_id):
                     # Found a potential match
                     placement = placement_data['placement']
@@ -91,42 +197,28 @@ def assign_placement_points(wrestler_results: dict, wrestler_placements: dict) -
     
     # Special fix for Caleb Smith
     for wrestler_id, result in wrestler_results.items():
-        if "Caleb Smith" in wrestler_id and "Nebraska" in wrestler_id:
+        wid_lower = wrestler_id.lower()
+        if all(token in wid_lower for token in _CALEB_MARKER):
             # Force correct placement
             result['placement'] = 7
             result['placement_points'] = 4.0
             log_debug(f"Applied special fix for Caleb Smith - set to 7th place")
     
-    # Final pass: Recalculate total points for all wrestlers based on matches
+    # Final pass: Recalculate total points for all wrestlers based on matches.
+    # The per-match sums come from one vectorized pass over the flattened
+    # match history instead of a nested Python loop
+    point_totals = _match_points_by_wrestler(wrestler_results)
     for wrestler_id, result in wrestler_results.items():
-        # Reset component calculations to ensure accuracy
-        champ_adv = 0.0
-        champ_bonus = 0.0
-        cons_adv = 0.0
-        cons_bonus = 0.0
-        placement_bonus = 0.0
-        
-        # Recalculate from individual matches to ensure accuracy
-        for match in result.get('matches', []):
-            round_type = match.get('round', '')
-            
-            # Handle placement matches correctly
-            if round_type == 'Placement' or '3rd Place' in round_type or '5th Place' in round_type or '7th Place' in round_type:
-                # For placement matches, only count bonus points, not advancement
-                placement_bonus += match.get('bonus_points', 0)
-            # Handle championship matches
-            elif match.get('round', '').startswith('Champ') or match.get('round', '') in ['Prelim', 'Quarters', 'Semis', 'Finals']:
-                # Count advancement and bonus for championship brackets
-                if match.get('advancement_points', 0) > 0:
-                    champ_adv += match.get('advancement_points', 0)
-                champ_bonus += match.get('bonus_points', 0)
-            # Handle consolation matches
-            elif match.get('round', '').startswith('Cons'):
-                # Count advancement and bonus for consolation brackets
-                if match.get('advancement_points', 0) > 0:
-                    cons_adv += match.get('advancement_points', 0)
-                cons_bonus += match.get('bonus_points', 0)
-        
+        totals = point_totals.get(wrestler_id)
+        if totals is None:
+            champ_adv = champ_bonus = cons_adv = cons_bonus = placement_bonus = 0.0
+        else:
+            champ_adv = totals['champ_adv']
+            champ_bonus = totals['champ_bonus']
+            cons_adv = totals['cons_adv']
+            cons_bonus = totals['cons_bonus']
+            placement_bonus = totals['placement_bonus']
+
         # Update result components
         result['champ_advancement'] = champ_adv
         result['champ_bonus'] = champ_bonus
@@ -142,8 +234,9 @@ def assign_placement_points(wrestler_results: dict, wrestler_placements: dict) -
             result['placement_points']
         )
         
-        # Debug output for verification
-        if "Caleb Smith" in wrestler_id and "Nebraska" in wrestler_id:
+        # Debug output for verification - skip the per-wrestler substring
+        # scans entirely when debug output is off
+        if config.DEBUG_MODE and all(token in wrestler_id.lower() for token in _CALEB_MARKER):
             print("\nCALEB SMITH SCORING DEBUG:")
             print(f"Placement: {result['placement']}")
             print(f"Placement Points: {result['placement_points']}")
@@ -2,25 +2,33 @@
 Wrestler matching functionality for the NCAA Wrestling Tournament Tracker
 """
 from typing import Dict, List, Any, Tuple, Optional
-from collections import defaultdict
+from collections import defaultdict, namedtuple
+import pandas as pd
 from ncaa_wrestling_tracker import config
 from ncaa_wrestling_tracker.utils.text_utils import standardize_text, standardize_wrestler_name
 from ncaa_wrestling_tracker.utils.logging_utils import log_debug, log_problem
 
+# Pre-standardized problem-wrestler entries plus the set of their last-name
+# tokens. Every problem-list match condition requires equal last names, so
+# one set probe skips the whole scan for the common clean-match case
+ProblemIndex = namedtuple('ProblemIndex', ['entries', 'last_names'])
 
-def build_wrestler_lookup(drafted_wrestlers: Dict[str, List[Dict[str, Any]]]) -> Tuple[Dict, Dict, List, Dict]:
+
+def build_wrestler_lookup(drafted_wrestlers: Dict[str, List[Dict[str, Any]]]) -> Tuple[Dict, Dict, List, Dict, Dict]:
     """
     Build a flexible lookup table for wrestlers
-    
+
     Args:
         drafted_wrestlers: Dictionary of drafted wrestlers by team
-        
+
     Returns:
-        Tuple of (wrestler_lookup, weight_seed_lookup, all_wrestlers, problem_wrestler_info)
+        Tuple of (wrestler_lookup, weight_seed_lookup, all_wrestlers
+        DataFrame, problem_index, override_index)
     """
     wrestler_lookup = {}
     weight_seed_lookup = {}  # For fallback matching by weight and seed
-    all_wrestlers = []  # To keep track of all drafted wrestlers for the round summary
+    all_wrestlers = []  # All drafted wrestlers; becomes a DataFrame below
+    override_index = {}  # (original name, original school) -> data, for name overrides
     
     # Store problematic wrestler info for reference
     problem_wrestler_info = {}
@@ -47,9 +55,15 @@ def build_wrestler_lookup(drafted_wrestlers: Dict[str, List[Dict[str, Any]]]) ->
                     }
                     log_problem(f"Found problematic wrestler in draft: {original_name} ({original_school}) - {weight} {seed}")
             
-            # Standard key - name and school exactly as in the spreadsheet
-            std_name = standardize_wrestler_name(original_name)
-            std_school = standardize_text(original_school)
+            # Standard key - name and school exactly as in the spreadsheet.
+            # The loader pre-standardizes both columns vectorized; fall back
+            # to the scalar path for records built elsewhere
+            std_name = wrestler.get('std_name')
+            if std_name is None:
+                std_name = standardize_wrestler_name(original_name)
+            std_school = wrestler.get('std_school')
+            if std_school is None:
+                std_school = standardize_text(original_school)
             
             # Store the data
             data = {
@@ -65,7 +79,11 @@ def build_wrestler_lookup(drafted_wrestlers: Dict[str, List[Dict[str, Any]]]) ->
             
             # Add to all wrestlers list
             all_wrestlers.append(data)
-            
+
+            # Index by original name/school so direct name overrides resolve
+            # with one dict probe
+            override_index[(original_name, original_school)] = data
+
             # Regular key (with standardized text)
             key = (std_name, std_school)
             wrestler_lookup[key] = data
@@ -91,43 +109,67 @@ def build_wrestler_lookup(drafted_wrestlers: Dict[str, List[Dict[str, Any]]]) ->
                 if weight_seed_key not in weight_seed_lookup or seed_num < weight_seed_lookup[weight_seed_key]['seed_num']:
                     weight_seed_lookup[weight_seed_key] = data
             
-            # Log the wrestler and their keys
-            log_message = f"Added wrestler: {original_name} ({original_school}) - Team: {team}, Weight: {weight}, Seed: {seed}"
+            # Log the wrestler and their keys. The debug branch runs for
+            # nearly every wrestler, so it passes format args lazily and
+            # pays no string building when debug logging is off
             if is_problematic:
-                log_problem(log_message)
+                log_problem(f"Added wrestler: {original_name} ({original_school}) - Team: {team}, Weight: {weight}, Seed: {seed}")
                 log_problem(f"  - Primary Key: {key}")
                 log_problem(f"  - Name-only Key: {name_only_key}")
                 log_problem(f"  - Last Name Key: {alt_key}")
                 if weight and seed_num:
                     log_problem(f"  - Weight-Seed Key: {weight_seed_key}")
             else:
-                log_debug(log_message)
-                log_debug(f"  - Primary Key: {key}")
-                log_debug(f"  - Name-only Key: {name_only_key}")
-                log_debug(f"  - Last Name Key: {alt_key}")
+                log_debug("Added wrestler: %s (%s) - Team: %s, Weight: %s, Seed: %s",
+                          original_name, original_school, team, weight, seed)
+                log_debug("  - Primary Key: %s", key)
+                log_debug("  - Name-only Key: %s", name_only_key)
+                log_debug("  - Last Name Key: %s", alt_key)
                 if weight and seed_num:
-                    log_debug(f"  - Weight-Seed Key: {weight_seed_key}")
+                    log_debug("  - Weight-Seed Key: %s", weight_seed_key)
     
     # Log total wrestlers loaded
     log_debug(f"Total wrestlers in lookup: {len(wrestler_lookup)}")
     log_debug(f"Total weight-seed combinations: {len(weight_seed_lookup)}")
-    
-    return wrestler_lookup, weight_seed_lookup, all_wrestlers, problem_wrestler_info
 
+    # Pre-standardize the problem list once; get_wrestler_data scans it for
+    # every match, so the per-entry standardize/split must not be repeated
+    # there
+    problem_tokens = []
+    for prob_name, info in problem_wrestler_info.items():
+        std_prob = standardize_text(prob_name)
+        problem_tokens.append((prob_name, std_prob, tuple(std_prob.split()), info))
+    problem_index = ProblemIndex(
+        tuple(problem_tokens),
+        frozenset(parts[-1] for _, _, parts, _ in problem_tokens if parts))
+
+    # Hand the roster to consumers as one columnar frame instead of a list
+    # of per-wrestler dicts; team and weight are low-cardinality, so store
+    # them as categoricals
+    all_wrestlers_df = pd.DataFrame.from_records(all_wrestlers)
+    if not all_wrestlers_df.empty:
+        all_wrestlers_df['team'] = all_wrestlers_df['team'].astype('category')
+        all_wrestlers_df['weight'] = all_wrestlers_df['weight'].astype('category')
+
+    return wrestler_lookup, weight_seed_lookup, all_wrestlers_df, problem_index, override_index
 
-def get_wrestler_data(match_info: Dict[str, Any], wrestler_key: str, 
-                     wrestler_lookup: Dict, weight_seed_lookup: Dict, 
-                     problem_wrestler_info: Dict) -> Tuple[Optional[Dict], Optional[Tuple], Optional[str]]:
+
+def get_wrestler_data(match_info: Dict[str, Any], wrestler_key: str,
+                     wrestler_lookup: Dict, weight_seed_lookup: Dict,
+                     problem_index: ProblemIndex,
+                     override_index: Dict) -> Tuple[Optional[Dict], Optional[Tuple], Optional[str]]:
     """
     Get wrestler data using flexible matching
-    
+
     Args:
         match_info: Dictionary with match information
         wrestler_key: 'winner' or 'loser' to indicate which wrestler to process
         wrestler_lookup: Dictionary of wrestlers by standardized (name, school)
         weight_seed_lookup: Dictionary of wrestlers by (weight, seed)
-        problem_wrestler_info: Dictionary of problematic wrestlers
-        
+        problem_index: Pre-standardized problem-wrestler entries with their
+            last-name token set
+        override_index: Dictionary of wrestlers by original (name, school)
+
     Returns:
         Tuple of (wrestler_data, used_key, match_method)
     """
@@ -148,25 +190,30 @@ def get_wrestler_data(match_info: Dict[str, Any], wrestler_key: str,
     if std_wrestler_full in config.DIRECT_NAME_OVERRIDES:
         override_name, override_school, override_team = config.DIRECT_NAME_OVERRIDES[std_wrestler_full]
         log_problem(f"DIRECT NAME OVERRIDE for {wrestler_key}: {wrestler_name} -> {override_name}")
-        
-        # Match this override to a wrestler in our draft data
-        for owner_team, wrestlers in wrestler_lookup.items():
-            for wrestler_key, wrestler_data in wrestler_lookup.items():
-                if wrestler_data['name'] == override_name and wrestler_data['school'] == override_school:
-                    used_key = "direct_override"
-                    match_method = "name_override"
-                    return wrestler_data, used_key, match_method
+
+        # Match this override to a wrestler in our draft data with a single
+        # index probe (the old double scan over wrestler_lookup also
+        # shadowed the wrestler_key argument)
+        wrestler_data = override_index.get((override_name, override_school))
+        if wrestler_data is not None:
+            used_key = "direct_override"
+            match_method = "name_override"
+            return wrestler_data, used_key, match_method
     
     # Special handling for problematic wrestlers - check if this wrestler is in our problem list
     # IMPROVED MATCHING LOGIC FOR PROBLEMATIC WRESTLERS
-    for wrestler_name_prob, info in problem_wrestler_info.items():
-        std_wrestler = standardize_text(wrestler_name_prob)
-        std_match_wrestler = standardize_text(wrestler_name)
-        
-        # Get first and last names for both wrestlers
-        wrestler_parts = std_wrestler.split()
-        match_parts = std_match_wrestler.split()
-        
+    # The match-side standardization is loop-invariant, so compute it once;
+    # the problem-list side comes pre-standardized from build_wrestler_lookup
+    std_match_wrestler = standardize_text(wrestler_name)
+    match_parts = std_match_wrestler.split()
+    # Every problem-list condition needs matching last names, so one set
+    # probe short-circuits the scan for the typical clean match
+    if match_parts and match_parts[-1] in problem_index.last_names:
+        problem_entries = problem_index.entries
+    else:
+        problem_entries = ()
+    for wrestler_name_prob, std_wrestler, wrestler_parts, info in problem_entries:
+
         # More precise matching to avoid mixing up wrestlers with same last name
         is_match = False
         
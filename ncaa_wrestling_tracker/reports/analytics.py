@@ -1,6 +1,7 @@
 """
 Analytics functionality for the NCAA Wrestling Tournament Tracker
 """
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 from typing import Dict, List, Any
@@ -18,31 +19,36 @@ def debug_wrestler(wrestler_name: str, results_df: pd.DataFrame) -> pd.DataFrame
     Returns:
         DataFrame subset containing matching wrestlers
     """
-    wrestler_rows = results_df[results_df['Wrestler'].str.contains(wrestler_name, case=False)]
-    
+    # regex=False keeps the lookup on the plain substring kernel of the
+    # string dtype instead of dispatching through the re engine
+    wrestler_rows = results_df[results_df['Wrestler'].str.contains(
+        wrestler_name, case=False, regex=False, na=False)]
+
     if len(wrestler_rows) == 0:
         print(f"No wrestlers found matching '{wrestler_name}'")
         return pd.DataFrame()
-        
-    for idx, row in wrestler_rows.iterrows():
-        print(f"\nDEBUG INFO FOR: {row['Wrestler']}")
-        print(f"Owner: {row['owner']}")
-        print(f"Weight: {row['weight']}")
-        print(f"Championship wins: {row['champ_wins']}")
-        print(f"Consolation wins: {row['cons_wins']}")
-        print(f"Total points: {row['total_points']}")
-        
-        if pd.notnull(row.get('placement')) and row.get('placement') is not None:
-            print(f"Placement: {int(row['placement'])}th place ({row.get('placement_points', 0)} points)")
-            
+
+    # itertuples avoids materializing a Series per row
+    for row in wrestler_rows.itertuples(index=False):
+        print(f"\nDEBUG INFO FOR: {row.Wrestler}")
+        print(f"Owner: {row.owner}")
+        print(f"Weight: {row.weight}")
+        print(f"Championship wins: {row.champ_wins}")
+        print(f"Consolation wins: {row.cons_wins}")
+        print(f"Total points: {row.total_points}")
+
+        placement = getattr(row, 'placement', None)
+        if pd.notnull(placement) and placement is not None:
+            print(f"Placement: {int(placement)}th place ({getattr(row, 'placement_points', 0)} points)")
+
         print("\nMatches:")
-        
-        for match in row['matches']:
+
+        for match in row.matches:
             print(f"  {match['round']} - {match['result']} over {match['opponent']} ({match['total_points']} pts)")
             print(f"    Match method: {match.get('match_method', 'unknown')}")
             if 'match_text' in match:
                 print(f"    Text: {match['match_text']}")
-                
+
     return wrestler_rows
 
 
@@ -56,36 +62,38 @@ def team_performance_analysis(results_df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with team performance analysis
     """
-    # Count types of wins by team
-    win_types = {}
-    
-    for _, wrestler in results_df.iterrows():
-        team = wrestler['owner']
-        if team not in win_types:
-            win_types[team] = {
-                'Fall': 0, 'TF': 0, 'MD': 0, 'Dec': 0, 'SV': 0, 'TB': 0, 'Other': 0
-            }
-        
-        for match in wrestler['matches']:
-            result = match['result']
-            if result in win_types[team]:
-                win_types[team][result] += 1
-            else:
-                win_types[team]['Other'] += 1
-    
-    # Convert to DataFrame
-    win_types_df = pd.DataFrame.from_dict(win_types, orient='index')
-    
+    # Count types of wins by team: explode the match lists into one long
+    # frame and cross-tabulate owner against win type, instead of iterating
+    # rows and dicts in Python
+    win_columns = ['Fall', 'TF', 'MD', 'Dec', 'SV', 'TB', 'Other']
+
+    exploded = results_df[['owner', 'matches']].explode('matches', ignore_index=True)
+    exploded = exploded.dropna(subset=['matches'])  # wrestlers with no matches
+    win_type = exploded['matches'].str.get('result')
+    win_type = win_type.where(win_type.isin(win_columns[:-1]), 'Other')
+
+    win_types_df = pd.crosstab(exploded['owner'], win_type)
+    # Keep every team (even with zero recorded wins) in first-appearance
+    # order, and every win-type column, as the dict-based version did
+    win_types_df = win_types_df.reindex(index=results_df['owner'].unique(), fill_value=0)
+    win_types_df = win_types_df.reindex(columns=win_columns, fill_value=0)
+    win_types_df = win_types_df.rename_axis(index=None, columns=None)
+
     # Add total wins column
     win_types_df['Total Wins'] = win_types_df.sum(axis=1)
     
-    # Calculate percentages
-    for col in ['Fall', 'TF', 'MD', 'Dec', 'SV', 'TB', 'Other']:
-        win_types_df[f'{col} %'] = (win_types_df[col] / win_types_df['Total Wins'] * 100).round(1)
-    
-    # Calculate bonus win percentage
-    win_types_df['Bonus Win %'] = ((win_types_df['Fall'] + win_types_df['TF'] + win_types_df['MD']) / 
-                                  win_types_df['Total Wins'] * 100).round(1)
+    # Calculate percentages: one broadcast division over the whole
+    # (teams x win types) block instead of seven column-at-a-time ops.
+    # float32 is plenty for win counts under a few hundred and halves the
+    # bytes the division touches; the count columns stay integers
+    counts = win_types_df[win_columns].to_numpy(dtype=np.float32)
+    total_wins = win_types_df['Total Wins'].to_numpy(dtype=np.float32)
+    pct = (counts / total_wins[:, None] * 100).round(1)
+    win_types_df[[f'{col} %' for col in win_columns]] = pct
+
+    # Calculate bonus win percentage (Fall, TF and MD are the first three
+    # win-type columns)
+    win_types_df['Bonus Win %'] = (counts[:, :3].sum(axis=1) / total_wins * 100).round(1)
     
     return win_types_df
 
@@ -121,15 +129,14 @@ def placement_analysis(results_df: pd.DataFrame) -> pd.DataFrame:
     # Add total All-Americans (placements) column
     placement_counts['Total AAs'] = placement_counts.sum(axis=1)
     
-    # Calculate placement points
+    # Calculate placement points: one ndarray multiply for all per-place
+    # columns and one dot product for the total, instead of eight
+    # column-at-a-time Series operations
     from .. import config
-    for place in range(1, 9):
-        if place in placement_counts.columns:
-            placement_counts[f'{place}th Points'] = placement_counts[place] * config.PLACEMENT_POINTS.get(place, 0)
-    
-    placement_counts['Total Placement Points'] = sum(
-        placement_counts[f'{place}th Points'] for place in range(1, 9) 
-        if f'{place}th Points' in placement_counts.columns
-    )
+    places = list(range(1, 9))
+    counts = placement_counts[places].to_numpy()
+    points_per_place = np.array([config.PLACEMENT_POINTS.get(place, 0) for place in places])
+    placement_counts[[f'{place}th Points' for place in places]] = counts * points_per_place
+    placement_counts['Total Placement Points'] = counts @ points_per_place
     
     return placement_counts
\ No newline at end of file
@@ -2,82 +2,133 @@
 Generate detailed reports for the NCAA Wrestling Tournament Tracker
 """
 import datetime
-from typing import Dict, Any, List
+import io
+from typing import Dict, Any, List, Optional, IO
 import pandas as pd
 
-def generate_detailed_report(results_df: pd.DataFrame, team_summary_df: pd.DataFrame, 
-                           results_file_path: str) -> str:
+# Match methods that are routine enough not to call out in the report
+_NAME_MATCH_METHODS = frozenset({'full_name', 'name_only'})
+
+
+def generate_detailed_report(results_df: pd.DataFrame, team_summary_df: pd.DataFrame,
+                           results_file_path: str,
+                           out: Optional[IO[str]] = None) -> Optional[str]:
     """
     Generate a detailed report including team standings and individual wrestler performances
     with correct NCAA scoring breakdown.
-    
+
     Args:
         results_df: DataFrame with wrestler results
         team_summary_df: DataFrame with team standings
         results_file_path: Path to the input results file
-        
+        out: Optional open text file to stream the report into; when given,
+            the report never exists as one big string in memory
+
     Returns:
-        String containing the full report
+        String containing the full report, or None when out is provided
     """
     # Get timestamp for the report
     timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    # Stream fragments straight to the destination (or an in-memory buffer
+    # for string-returning callers) - repeated str += can go quadratic on
+    # large reports
+    buffer = io.StringIO() if out is None else None
+    write = buffer.write if out is None else out.write
+    write("NCAA WRESTLING TOURNAMENT DRAFT RESULTS\n")
+    write(f"Generated: {timestamp}\n")
+    write(f"Source File: {results_file_path}\n")
+    write("=" * 50 + "\n\n")
     
-    report = f"NCAA WRESTLING TOURNAMENT DRAFT RESULTS\n"
-    report += f"Generated: {timestamp}\n"
-    report += f"Source File: {results_file_path}\n"
-    report += "=" * 50 + "\n\n"
-    
-    # Team Standings
-    report += "TEAM STANDINGS\n"
-    report += "-" * 50 + "\n"
-    for i, row in team_summary_df.iterrows():
-        report += f"{i+1}. {row['owner']} - {row['total_points']} points\n"
-        report += f"   Advancement: {row['total_advancement']} points (Champ: {row['champ_advancement']}, Cons: {row['cons_advancement']})\n"
-        report += f"   Bonus: {row['total_bonus']} points (Champ: {row['champ_bonus']}, Cons: {row['cons_bonus']})\n"
-        
+    # Team Standings. itertuples avoids building a Series per row; the
+    # numbering keeps the frame's index labels exactly as iterrows used them.
+    # 'Wrestlers with Points' is pulled out as an array because its name is
+    # not a valid attribute
+    has_placement = 'placement_points' in team_summary_df.columns
+    wrestlers_with_points = team_summary_df['Wrestlers with Points'].to_numpy()
+    write("TEAM STANDINGS\n")
+    write("-" * 50 + "\n")
+    for position, row in enumerate(team_summary_df.itertuples()):
+        write(f"{row.Index+1}. {row.owner} - {row.total_points} points\n")
+        write(f"   Advancement: {row.total_advancement} points (Champ: {row.champ_advancement}, Cons: {row.cons_advancement})\n")
+        write(f"   Bonus: {row.total_bonus} points (Champ: {row.champ_bonus}, Cons: {row.cons_bonus})\n")
+
         # Add placement points if available
-        if 'placement_points' in row:
-            report += f"   Placement: {row['placement_points']} points\n"
-            
-        report += f"   Wrestlers with points: {row['Wrestlers with Points']}\n\n"
+        if has_placement:
+            write(f"   Placement: {row.placement_points} points\n")
+
+        write(f"   Wrestlers with points: {wrestlers_with_points[position]}\n\n")
     
-    # Individual Performances by Team
+    # Individual Performances by Team. Column presence is a frame-level
+    # fact, so test it once here rather than per row below
+    result_columns = results_df.columns
+    has_wrestler_placement = 'placement' in result_columns
+
+    # Fill in any missing scoring components and precompute the displayed
+    # advancement/bonus totals as whole columns - vectorized adds instead
+    # of two Python additions per wrestler at format time. assign() leaves
+    # the caller's frame untouched
+    work = results_df
+    if 'champ_advancement' not in result_columns:
+        work = work.assign(champ_advancement=work['champ_wins'] * 1.0)
+    if 'cons_advancement' not in result_columns:
+        work = work.assign(cons_advancement=work['cons_wins'] * 0.5)
+    if 'champ_bonus' not in result_columns:
+        work = work.assign(champ_bonus=0, cons_bonus=0)
+    work = work.assign(adv_total=work['champ_advancement'] + work['cons_advancement'],
+                       bonus_total=work['champ_bonus'] + work['cons_bonus'])
+
+    # Group once and sort each sub-frame up front instead of re-scanning
+    # the owner column per team
+    teams_grouped = {
+        owner: sub.sort_values('total_points', ascending=False)
+        for owner, sub in work.groupby('owner', sort=False, observed=True)
+    }
     for team in team_summary_df['owner']:
-        report += f"\n{team} WRESTLERS\n"
-        report += "-" * 50 + "\n"
-        
-        team_wrestlers = results_df[results_df['owner'] == team].sort_values('total_points', ascending=False)
-        
-        for i, wrestler in team_wrestlers.iterrows():
-            # Calculate advancement points for this wrestler
-            champ_advancement = wrestler.get('champ_advancement', wrestler.get('champ_wins', 0) * 1.0)
-            cons_advancement = wrestler.get('cons_advancement', wrestler.get('cons_wins', 0) * 0.5)
-            
-            report += f"{wrestler['weight']} - {wrestler['Wrestler']} ({wrestler['seed']}): {wrestler['total_points']} points\n"
-            report += f"   Advancement: {champ_advancement + cons_advancement} (Champ: {champ_advancement}, Cons: {cons_advancement})\n"
-            report += f"   Bonus: {wrestler.get('champ_bonus', 0) + wrestler.get('cons_bonus', 0)} (Champ: {wrestler.get('champ_bonus', 0)}, Cons: {wrestler.get('cons_bonus', 0)})\n"
-            
+        write(f"\n{team} WRESTLERS\n")
+        write("-" * 50 + "\n")
+
+        team_wrestlers = teams_grouped[team]
+
+        # One notna pass over the placement column replaces a pd.notnull
+        # call per wrestler; the loop indexes the masks positionally
+        if has_wrestler_placement:
+            placement_arr = team_wrestlers['placement'].to_numpy()
+            placed = team_wrestlers['placement'].notna().to_numpy()
+
+        for position, wrestler in enumerate(team_wrestlers.itertuples(index=False)):
+            write(f"{wrestler.weight} - {wrestler.Wrestler} ({wrestler.seed}): {wrestler.total_points} points\n")
+            write(f"   Advancement: {wrestler.adv_total} (Champ: {wrestler.champ_advancement}, Cons: {wrestler.cons_advancement})\n")
+            write(f"   Bonus: {wrestler.bonus_total} (Champ: {wrestler.champ_bonus}, Cons: {wrestler.cons_bonus})\n")
+
             # Add placement info if available
-            if pd.notnull(wrestler.get('placement')) and wrestler.get('placement') is not None:
-                report += f"   Placement: {int(wrestler['placement'])}th place ({wrestler.get('placement_points', 0)} points)\n"
-            
+            if has_wrestler_placement and placed[position]:
+                write(f"   Placement: {int(placement_arr[position])}th place ({wrestler.placement_points} points)\n")
+
             # Add match details
-            if isinstance(wrestler['matches'], list) and wrestler['matches']:
-                for match in wrestler['matches']:
-                    match_method_text = ""
-                    if 'match_method' in match and match['match_method'] not in ["full_name", "name_only"]:
-                        match_method_text = f" [matched by {match['match_method']}]"
-                    
+            if isinstance(wrestler.matches, list) and wrestler.matches:
+                for match in wrestler.matches:
+                    # One .get per optional key instead of a membership test
+                    # followed by an indexing; the set probe beats the old
+                    # two-element list scan
+                    match_method = match.get('match_method')
+                    if match_method and match_method not in _NAME_MATCH_METHODS:
+                        match_method_text = f" [matched by {match_method}]"
+                    else:
+                        match_method_text = ""
+
                     # Show the full win type description for sudden victory and tie breaker
                     result_text = match['result']
-                    if result_text in ['SV', 'TB'] and 'win_type_full' in match:
-                        result_text = match['win_type_full']
-                    
-                    report += f"   {match['round']} - {result_text} over {match['opponent']} ({match['total_points']} pts = {match['advancement_points']} adv + {match['bonus_points']} bonus){match_method_text}\n"
+                    if result_text in ('SV', 'TB'):
+                        result_text = match.get('win_type_full', result_text)
+
+                    write(f"   {match['round']} - {result_text} over {match['opponent']} ({match['total_points']} pts = {match['advancement_points']} adv + {match['bonus_points']} bonus){match_method_text}\n")
             
-            report += "\n"
+            write("\n")
     
-    return report
+    if buffer is not None:
+        return buffer.getvalue()
+    return None
 
 
 def generate_summary_report(team_summary_df: pd.DataFrame) -> str:
@@ -90,21 +141,29 @@ def generate_summary_report(team_summary_df: pd.DataFrame) -> str:
     Returns:
         String containing the summary report
     """
-    report = "TEAM STANDINGS:\n"
-    report += "-" * 80 + "\n"
-    report += f"{'Rank':<5}{'Team':<25}{'Total':<10}{'Adv':<10}{'Bonus':<10}"
-    
-    if 'placement_points' in team_summary_df.columns:
-        report += f"{'Placement':<10}"
-        
-    report += "\n" + "-" * 80 + "\n"
-    
-    for i, row in team_summary_df.iterrows():
-        line = f"{i+1:<5}{row['owner']:<25}{row['total_points']:<10}{row['total_advancement']:<10}{row['total_bonus']:<10}"
-        
-        if 'placement_points' in row:
-            line += f"{row['placement_points']:<10}"
-            
-        report += line + "\n"
-        
-    return report
\ No newline at end of file
+    parts = ["TEAM STANDINGS:\n"]
+    parts.append("-" * 80 + "\n")
+    parts.append(f"{'Rank':<5}{'Team':<25}{'Total':<10}{'Adv':<10}{'Bonus':<10}")
+
+    has_placement = 'placement_points' in team_summary_df.columns
+    if has_placement:
+        parts.append(f"{'Placement':<10}")
+
+    parts.append("\n" + "-" * 80 + "\n")
+
+    # Format straight from the column arrays - no per-row Series. The rank
+    # column reuses the frame's index labels, as the iterrows version did
+    columns = [team_summary_df.index.to_numpy() + 1,
+               team_summary_df['owner'].to_numpy(),
+               team_summary_df['total_points'].to_numpy(),
+               team_summary_df['total_advancement'].to_numpy(),
+               team_summary_df['total_bonus'].to_numpy()]
+    if has_placement:
+        columns.append(team_summary_df['placement_points'].to_numpy())
+        for rank, owner, total, adv, bonus, placement in zip(*columns):
+            parts.append(f"{rank:<5}{owner:<25}{total:<10}{adv:<10}{bonus:<10}{placement:<10}\n")
+    else:
+        for rank, owner, total, adv, bonus in zip(*columns):
+            parts.append(f"{rank:<5}{owner:<25}{total:<10}{adv:<10}{bonus:<10}\n")
+
+    return ''.join(parts)
\ No newline at end of file
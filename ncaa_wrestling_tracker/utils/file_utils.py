@@ -14,11 +14,13 @@ def create_output_directory() -> str:
     Returns:
         Path to the output directory
     """
-    if not os.path.exists(config.OUTPUT_DIR):
-        os.makedirs(config.OUTPUT_DIR)
-        print(f"Created output directory: {config.OUTPUT_DIR}")
-    
-    return config.OUTPUT_DIR
+    # ensure_output_dir uses makedirs(exist_ok=True): one atomic call, no
+    # exists-then-create race. The directory is timestamped per run, so the
+    # message is accurate without a separate existence probe
+    output_dir = config.ensure_output_dir()
+    print(f"Created output directory: {output_dir}")
+
+    return output_dir
 
 
 def save_input_copy(output_dir: str, results_file: str) -> None:
@@ -31,8 +33,9 @@ def save_input_copy(output_dir: str, results_file: str) -> None:
     """
     output_file = os.path.join(output_dir, "input_results.txt")
     try:
-        with open(results_file, 'r') as src, open(output_file, 'w') as dst:
-            dst.write(src.read())
+        # copyfile stays in the kernel (sendfile) instead of round-tripping
+        # the whole file through a Python string
+        shutil.copyfile(results_file, output_file)
         print(f"Saved copy of input file to {output_file}")
     except Exception as e:
         print(f"Warning: Could not save input file copy: {e}")
@@ -48,8 +51,7 @@ def save_draft_copy(output_dir: str, draft_file: str) -> None:
     """
     output_file = os.path.join(output_dir, "draft_data.csv")
     try:
-        with open(draft_file, 'r') as src, open(output_file, 'w') as dst:
-            dst.write(src.read())
+        shutil.copyfile(draft_file, output_file)
         print(f"Saved copy of draft file to {output_file}")
     except Exception as e:
         print(f"Warning: Could not save draft file copy: {e}")
@@ -66,24 +68,30 @@ def create_readme(output_dir: str) -> None:
     
     readme_file = os.path.join(output_dir, "README.txt")
     try:
+        # Assemble the body as one string and write it in a single call
+        # instead of a dozen small writes through the I/O buffer
+        timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        body = (
+            f"NCAA Wrestling Tournament Results\n"
+            f"Generated: {timestamp}\n\n"
+            f"Input Files:\n"
+            f"- Draft Data: {config.DRAFT_CSV}\n"
+            f"- Results: {config.RESULTS_FILE}\n\n"
+            "Output Files:\n"
+            "- tournament_report.txt: Detailed text report with all results\n"
+            "- wrestler_results.csv: CSV file with individual wrestler performance\n"
+            "- team_standings.csv: CSV file with team standings\n"
+            "- round_by_round_summary.csv: CSV file showing W/L for each wrestler by round\n"
+            "- wrestler_placements.csv: CSV file with wrestler placements\n"
+            "- draft_data.csv: Copy of the input draft file\n"
+            "- input_results.txt: Copy of the input results file\n"
+            "- debug_log.txt: Detailed processing log\n"
+            "- problem_cases.txt: Special cases requiring attention\n"
+        )
+        if os.path.exists(config.OUTPUT_MISMATCHES):
+            body += "- mismatched_wrestlers.csv: List of wrestlers that couldn't be matched\n"
         with open(readme_file, "w") as f:
-            f.write(f"NCAA Wrestling Tournament Results\n")
-            f.write(f"Generated: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            f.write(f"Input Files:\n")
-            f.write(f"- Draft Data: {config.DRAFT_CSV}\n")
-            f.write(f"- Results: {config.RESULTS_FILE}\n\n")
-            f.write(f"Output Files:\n")
-            f.write(f"- tournament_report.txt: Detailed text report with all results\n")
-            f.write(f"- wrestler_results.csv: CSV file with individual wrestler performance\n")
-            f.write(f"- team_standings.csv: CSV file with team standings\n")
-            f.write(f"- round_by_round_summary.csv: CSV file showing W/L for each wrestler by round\n")
-            f.write(f"- wrestler_placements.csv: CSV file with wrestler placements\n")
-            f.write(f"- draft_data.csv: Copy of the input draft file\n")
-            f.write(f"- input_results.txt: Copy of the input results file\n")
-            f.write(f"- debug_log.txt: Detailed processing log\n")
-            f.write(f"- problem_cases.txt: Special cases requiring attention\n")
-            if os.path.exists(config.OUTPUT_MISMATCHES):
-                f.write(f"- mismatched_wrestlers.csv: List of wrestlers that couldn't be matched\n")
+            f.write(body)
         print(f"Created README file: {readme_file}")
     except Exception as e:
         print(f"Warning: Could not create README file: {e}")
\ No newline at end of file
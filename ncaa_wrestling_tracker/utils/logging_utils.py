@@ -1,35 +1,78 @@
 """
 Logging utilities for the NCAA Wrestling Tournament Tracker
 """
-import os
-from typing import List
+import threading
+from typing import Optional, TextIO
 from ncaa_wrestling_tracker import config
 
-# Initialize debug log
-debug_log: List[str] = []
-problem_cases: List[str] = []
+# Log files are opened lazily on the first message and written through a
+# large buffer as messages arrive, instead of accumulating every line in a
+# module-level list and joining it at shutdown. Peak memory stays flat no
+# matter how chatty a run is. The output directory always exists by the
+# time the first message is logged (main() creates it up front). Newlines
+# go before each message after the first, so the file bytes match what
+# '\n'.join() produced
+_BUFFER_SIZE = 1 << 16
+_debug_fh: Optional[TextIO] = None
+_problem_fh: Optional[TextIO] = None
 
-def log_debug(message: str) -> None:
-    """Add a message to the debug log"""
-    if config.DEBUG_MODE:
-        debug_log.append(message)
-        print(f"DEBUG: {message}")
+# One lock per process keeps the lazy open and the separator+message write
+# pair atomic if processing is ever parallelized; uncontended acquisition
+# is a few nanoseconds, so single-threaded runs pay nothing measurable
+_log_lock = threading.Lock()
 
-def log_problem(message: str) -> None:
-    """Add a message to the problem cases log"""
-    problem_cases.append(message)
+def log_debug(message: str, *args) -> None:
+    """Add a message to the debug log. Extra args are %-formatted into the
+    message lazily, so call sites pay no formatting cost when debug logging
+    is off"""
+    global _debug_fh
+    if args:
+        message = message % args
+    with _log_lock:
+        if _debug_fh is None:
+            _debug_fh = open(config.OUTPUT_DEBUG, 'w', buffering=_BUFFER_SIZE)
+        else:
+            _debug_fh.write('\n')
+        _debug_fh.write(message)
+    print(f"DEBUG: {message}")
+
+if not config.DEBUG_MODE:
+    # DEBUG_MODE is a configuration constant, so the dispatch is decided
+    # once at import: with debug off, calls hit this no-op instead of
+    # re-testing the flag inside the real function every time
+    def log_debug(message: str, *args) -> None:  # noqa: F811
+        """No-op stand-in bound when debug logging is disabled"""
+
+def log_problem(message: str, *args) -> None:
+    """Add a message to the problem cases log (lazy %-formatting as in
+    log_debug)"""
+    global _problem_fh
+    if args:
+        message = message % args
+    with _log_lock:
+        if _problem_fh is None:
+            _problem_fh = open(config.OUTPUT_PROBLEM_CASES, 'w', buffering=_BUFFER_SIZE)
+        else:
+            _problem_fh.write('\n')
+        _problem_fh.write(message)
     print(f"PROBLEM: {message}")
 
 def save_debug_log() -> None:
-    """Save the debug log to a file"""
-    if config.DEBUG_MODE and debug_log:
-        with open(config.OUTPUT_DEBUG, 'w') as f:
-            f.write('\n'.join(debug_log))
-        print(f"Debug log saved to {config.OUTPUT_DEBUG}")
+    """Flush and close the debug log; a later run reopens it fresh"""
+    global _debug_fh
+    with _log_lock:
+        if _debug_fh is None:
+            return
+        _debug_fh.close()
+        _debug_fh = None
+    print(f"Debug log saved to {config.OUTPUT_DEBUG}")
 
 def save_problem_cases() -> None:
-    """Save problem cases to a file"""
-    if problem_cases:
-        with open(config.OUTPUT_PROBLEM_CASES, 'w') as f:
-            f.write('\n'.join(problem_cases))
-        print(f"Problem cases saved to {config.OUTPUT_PROBLEM_CASES}")
\ No newline at end of file
+    """Flush and close the problem cases log; a later run reopens it fresh"""
+    global _problem_fh
+    with _log_lock:
+        if _problem_fh is None:
+            return
+        _problem_fh.close()
+        _problem_fh = None
+    print(f"Problem cases saved to {config.OUTPUT_PROBLEM_CASES}")
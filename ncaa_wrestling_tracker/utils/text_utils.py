@@ -1,18 +1,36 @@
 """
 Text processing utilities for the NCAA Wrestling Tournament Tracker
 """
+import functools
 import re
+import sys
 from typing import Optional
+import pandas as pd
 from ncaa_wrestling_tracker import config
 
+# Compiled once and shared by the scalar and vectorized standardizers
+_WS_RE = re.compile(r'\s+')
+_PUNCT_RE = re.compile(r'[\'`''"",.()-]')
+_SEED_RE = re.compile(r'#?(\d+)')
+_ROUND_NUM_RE = re.compile(r'Round (\d+)')
 
+# Known spelling variants mapped to a common stem (see
+# standardize_wrestler_name)
+NAME_STEMS = {
+    'thomson': 'thoms', 'thompson': 'thoms',
+    'keuter': 'kuet', 'kueter': 'kuet',
+}
+
+
+@functools.lru_cache(maxsize=8192)
 def standardize_text(text: str) -> str:
     """
-    Standardize text for more flexible matching
-    
+    Standardize text for more flexible matching. Memoized: the same names
+    and schools are standardized over and over during match processing
+
     Args:
         text: Text to standardize
-        
+
     Returns:
         Standardized text
     """
@@ -21,18 +39,38 @@ def standardize_text(text: str) -> str:
     
     # Lowercase, strip whitespace, replace multiple spaces with single space
     text = text.lower().strip()
-    text = re.sub(r'\s+', ' ', text)
-    
+    text = _WS_RE.sub(' ', text)
+
     # Remove apostrophes, backticks, and other special characters that might cause matching issues
-    text = re.sub(r'[\'`''"",.()-]', '', text)  # Remove apostrophes, backticks, quotes, commas, periods, etc.
-    
-    # Check if this is a school name and apply mapping
-    if text in config.SCHOOL_MAPPINGS:
-        return config.SCHOOL_MAPPINGS[text]
+    text = _PUNCT_RE.sub('', text)
     
-    return text
+    # Check if this is a school name and apply mapping - a single dict.get
+    # does one hash probe instead of a membership test plus a lookup.
+    # Interning the result lets the (name, school) lookup keys built from it
+    # hash and compare by pointer
+    return sys.intern(config.SCHOOL_MAPPINGS.get(text, text))
 
 
+def standardize_series(texts: pd.Series) -> pd.Series:
+    """
+    Vectorized standardize_text for a whole column: the same lowercase,
+    whitespace-collapse, punctuation-strip and school-mapping steps run as
+    C string kernels over the full Series
+
+    Args:
+        texts: Series of names or schools to standardize
+
+    Returns:
+        Series of standardized text
+    """
+    out = texts.str.lower().str.strip()
+    out = out.str.replace(_WS_RE, ' ', regex=True)
+    out = out.str.replace(_PUNCT_RE, '', regex=True)
+    mapped = out.map(config.SCHOOL_MAPPINGS)
+    return mapped.fillna(out)
+
+
+@functools.lru_cache(maxsize=8192)
 def standardize_wrestler_name(name: str) -> str:
     """
     Standardize wrestler names to handle common spelling variations
@@ -44,16 +82,10 @@ def standardize_wrestler_name(name: str) -> str:
         Standardized wrestler name
     """
     name = standardize_text(name)  # Apply base standardization first
-    
-    # Handle the Thomson/Thompson variation
-    if name in ['thomson', 'thompson']:
-        return 'thoms'  # Generic stem that will match either spelling
-    
-    # Handle Keuter/Kueter variation
-    if name in ['keuter', 'kueter']:
-        return 'kuet'  # Generic stem that will match either spelling
-    
-    return name
+
+    # Map known spelling variants (Thomson/Thompson, Keuter/Kueter) to a
+    # generic stem that will match either spelling
+    return NAME_STEMS.get(name, name)
 
 
 def extract_seed_number(seed_text: Optional[str]) -> Optional[int]:
@@ -68,7 +100,7 @@ def extract_seed_number(seed_text: Optional[str]) -> Optional[int]:
     """
     if not seed_text:
         return None
-    match = re.search(r'#?(\d+)', seed_text)
+    match = _SEED_RE.search(seed_text)
     if match:
         return int(match.group(1))
     return None
@@ -86,7 +118,7 @@ def extract_round_number(round_text: Optional[str]) -> Optional[int]:
     """
     if not round_text:
         return None
-    match = re.search(r'Round (\d+)', round_text)
+    match = _ROUND_NUM_RE.search(round_text)
     if match:
         return int(match.group(1))
     return None
\ No newline at end of file